@@ -0,0 +1,357 @@
+import argparse
+import json
+import os
+import shutil
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+LOG_DIR = os.environ.get("SLOTIN_APPOINTMENT_LOGS", "data/appointment-logs")
+CACHE_DIR = os.environ.get("SLOTIN_ANALYTICS_CACHE", "data/analytics-cache")
+
+# Bump when the cache layout changes; an older cache is rebuilt from the logs
+CACHE_VERSION = 1
+
+LOG_COLUMNS = ["appointment_id", "provider", "service", "booked_at", "start_at", "status"]
+
+STATUSES = ["booked", "completed", "no_show", "cancelled"]
+
+SERVICES = ["General Practice", "Dental", "Physiotherapy", "Haircut", "Beauty", "Fitness", "Veterinary", "Counselling"]
+
+# Lead-time histogram edges in hours; fixed so per-file histograms add up
+LEAD_TIME_EDGES = np.array([0, 1, 4, 12, 24, 48, 72, 168, 336, 720, 2160])
+
+LEAD_TIME_LABELS = ["<1h", "1-4h", "4-12h", "12-24h", "1-2d", "2-3d", "3-7d", "1-2w", "2-4w", "1-3mo", ">3mo"]
+
+CHUNK_ROWS = 1_000_000
+
+# 1970-01-01 was a Thursday
+EPOCH_WEEKDAY = 3
+
+WEEKDAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+
+def to_minutes(column):
+    # Epoch seconds or ISO 8601 strings -> minutes since the epoch
+    if pd.api.types.is_numeric_dtype(column):
+        return (column.to_numpy(np.int64) // 60).astype(np.int32)
+    stamps = pd.to_datetime(column, format="ISO8601", utc=True)
+    return (stamps.to_numpy("datetime64[m]").astype(np.int64)).astype(np.int32)
+
+def encode(column, names):
+    # Dictionary-encode against the cache-wide name list, extending it in place
+    codes, uniques = pd.factorize(column.astype(str))
+    index = {name: code for code, name in enumerate(names)}
+    for name in uniques:
+        if name not in index:
+            index[name] = len(names)
+            names.append(name)
+    lookup = np.array([index[name] for name in uniques], dtype=np.int32)
+    return lookup[codes]
+
+def read_log(path, chunksize=CHUNK_ROWS):
+    if path.endswith((".jsonl", ".json")):
+        return pd.read_json(path, lines=True, chunksize=chunksize, dtype=False)
+    return pd.read_csv(path, usecols=LOG_COLUMNS[1:], chunksize=chunksize, dtype={"provider": str, "service": str, "status": str})
+
+def empty_aggregates(providers=0, services=0):
+    return {
+        "hour": np.zeros(24, np.int64),
+        "weekday": np.zeros(7, np.int64),
+        "status": np.zeros(len(STATUSES), np.int64),
+        "lead_time": np.zeros(len(LEAD_TIME_LABELS), np.int64),
+        "provider_bookings": np.zeros(providers, np.int64),
+        "provider_no_shows": np.zeros(providers, np.int64),
+        "provider_attended": np.zeros(providers, np.int64),
+        "service_bookings": np.zeros(services, np.int64),
+        "service_no_shows": np.zeros(services, np.int64),
+        "service_attended": np.zeros(services, np.int64),
+    }
+
+def aggregate(columns, providers, services):
+    # Every aggregate is a count, so per-chunk results simply add up
+    start, lead = columns["start"], columns["lead"]
+    provider, service, status = columns["provider"], columns["service"], columns["status"]
+    no_show = status == STATUSES.index("no_show")
+    attended = no_show | (status == STATUSES.index("completed"))
+    hours = start // 60
+    lead_bins = np.searchsorted(LEAD_TIME_EDGES, lead / 60, side="right") - 1
+    return {
+        "hour": np.bincount(hours % 24, minlength=24),
+        "weekday": np.bincount((hours // 24 + EPOCH_WEEKDAY) % 7, minlength=7),
+        "status": np.bincount(status, minlength=len(STATUSES)),
+        "lead_time": np.bincount(np.clip(lead_bins, 0, len(LEAD_TIME_LABELS) - 1), minlength=len(LEAD_TIME_LABELS)),
+        "provider_bookings": np.bincount(provider, minlength=providers),
+        "provider_no_shows": np.bincount(provider[no_show], minlength=providers),
+        "provider_attended": np.bincount(provider[attended], minlength=providers),
+        "service_bookings": np.bincount(service, minlength=services),
+        "service_no_shows": np.bincount(service[no_show], minlength=services),
+        "service_attended": np.bincount(service[attended], minlength=services),
+    }
+
+def combine(total, part, sign=1):
+    for key, values in part.items():
+        if len(total[key]) < len(values):
+            total[key] = np.pad(total[key], (0, len(values) - len(total[key])))
+        total[key][: len(values)] += sign * values
+    return total
+
+def no_show_rate(no_shows, attended):
+    return np.divide(no_shows, attended, out=np.zeros(len(attended)), where=attended > 0)
+
+# Each log file becomes chunk directories of .npy columns, memory-mapped on read.
+# aggregates.npz holds running totals that are adjusted per file as logs are
+# added, changed or removed, so the charts never rescan history.
+class AnalyticsCache:
+    COLUMNS = {"provider": np.int32, "service": np.int16, "status": np.int8, "start": np.int32, "lead": np.int32}
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = cache_dir
+        self._lock = threading.Lock()
+        self._reload()
+
+    def _reload(self):
+        self._stamp = self._manifest_stamp()
+        self.manifest = self._load_manifest()
+        self.aggregates = self._load_aggregates()
+
+    def _manifest_stamp(self):
+        try:
+            return os.stat(self._path("manifest.json")).st_mtime_ns
+        except OSError:
+            return None
+
+    def _path(self, *parts):
+        return os.path.join(self.cache_dir, *parts)
+
+    def _load_manifest(self):
+        try:
+            with open(self._path("manifest.json")) as f:
+                manifest = json.load(f)
+            if manifest.get("version") == CACHE_VERSION:
+                return manifest
+        except (OSError, ValueError):
+            pass
+        shutil.rmtree(self._path("chunks"), ignore_errors=True)
+        return {"version": CACHE_VERSION, "sources": {}, "failed": {}, "providers": [], "services": [], "next_chunk": 0}
+
+    def _load_aggregates(self):
+        totals = empty_aggregates(len(self.manifest["providers"]), len(self.manifest["services"]))
+        if self.manifest["sources"]:
+            with np.load(self._path("aggregates.npz")) as stored:
+                totals.update({key: stored[key] for key in stored.files})
+        return totals
+
+    def _save(self):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Write then rename so a reader never sees half a manifest
+        np.savez(self._path("aggregates.tmp.npz"), **self.aggregates)
+        os.replace(self._path("aggregates.tmp.npz"), self._path("aggregates.npz"))
+        with open(self._path("manifest.tmp.json"), "w") as f:
+            json.dump(self.manifest, f)
+        os.replace(self._path("manifest.tmp.json"), self._path("manifest.json"))
+        self._stamp = self._manifest_stamp()
+
+    @property
+    def rows(self):
+        return sum(source["rows"] for source in self.manifest["sources"].values())
+
+    def chunk(self, name):
+        return {column: np.load(self._path("chunks", name, column + ".npy"), mmap_mode="r") for column in self.COLUMNS}
+
+    def chunks(self):
+        names = [name for source in list(self.manifest["sources"].values()) for name in source["chunks"]]
+        for name in names:
+            yield self.chunk(name)
+
+    def _write_chunk(self, columns):
+        name = f"{self.manifest['next_chunk']:06d}"
+        self.manifest["next_chunk"] += 1
+        os.makedirs(self._path("chunks", name), exist_ok=True)
+        for column, dtype in self.COLUMNS.items():
+            np.save(self._path("chunks", name, column + ".npy"), columns[column].astype(dtype, copy=False))
+        return name
+
+    def _ingest(self, path):
+        providers, services = self.manifest["providers"], self.manifest["services"]
+        chunks, rows, totals = [], 0, empty_aggregates()
+        for frame in read_log(path):
+            missing = [column for column in LOG_COLUMNS[1:] if column not in frame.columns]
+            if missing:
+                raise ValueError(f"{path}: missing column(s) {', '.join(missing)}")
+            start = to_minutes(frame["start_at"])
+            status = pd.Categorical(frame["status"], categories=STATUSES)
+            if (status.codes < 0).any():
+                unknown = sorted(set(frame["status"][status.codes < 0].astype(str)))
+                raise ValueError(f"{path}: unknown status {', '.join(unknown)}; expected one of {', '.join(STATUSES)}")
+            columns = {
+                "provider": encode(frame["provider"], providers),
+                "service": encode(frame["service"], services),
+                "status": status.codes.astype(np.int8),
+                "start": start,
+                "lead": np.maximum(start - to_minutes(frame["booked_at"]), 0),
+            }
+            chunks.append(self._write_chunk(columns))
+            combine(totals, aggregate(columns, len(providers), len(services)))
+            rows += len(frame)
+        return chunks, rows, totals
+
+    def refresh(self, log_dir=LOG_DIR):
+        # Fold new, changed and deleted log files into the cache; only those files are read
+        with self._lock:
+            # Another process (app.py analytics) may have updated the cache since we loaded it
+            if self._manifest_stamp() != self._stamp:
+                self._reload()
+            found = {}
+            if os.path.isdir(log_dir):
+                for entry in sorted(os.scandir(log_dir), key=lambda entry: entry.name):
+                    if entry.is_file() and entry.name.endswith((".csv", ".jsonl", ".json")):
+                        stat = entry.stat()
+                        found[os.path.abspath(entry.path)] = [stat.st_size, stat.st_mtime_ns]
+            sources, failed = self.manifest["sources"], self.manifest["failed"]
+            removed = [path for path in sources if path not in found]
+            changed = [path for path, stamp in found.items() if path in sources and sources[path]["stamp"] != stamp]
+            # Files that failed to parse are retried only once they change
+            added = [path for path, stamp in found.items() if path not in sources and failed.get(path, {}).get("stamp") != stamp]
+            for path in [path for path in failed if path not in found]:
+                del failed[path]
+            if not (removed or changed or added):
+                return {"added": [], "changed": [], "removed": [], "failed": [], "rows": 0, "seconds": 0.0}
+
+            start = time.perf_counter()
+            providers, services = self.manifest["providers"], self.manifest["services"]
+            ingested = {}
+            for path in changed + added:
+                first_chunk, known = self.manifest["next_chunk"], (len(providers), len(services))
+                try:
+                    ingested[path] = self._ingest(path)
+                    failed.pop(path, None)
+                except (ValueError, OSError) as error:
+                    # Roll back this file only; the rest of the refresh goes ahead
+                    for number in range(first_chunk, self.manifest["next_chunk"]):
+                        shutil.rmtree(self._path("chunks", f"{number:06d}"), ignore_errors=True)
+                    del providers[known[0]:], services[known[1]:]
+                    failed[path] = {"stamp": found[path], "error": str(error)}
+
+            # Sessions keep reading the old totals until the new ones are swapped in
+            totals = {key: values.copy() for key, values in self.aggregates.items()}
+            stale = []
+            for path in removed + changed:
+                for name in sources.pop(path)["chunks"]:
+                    combine(totals, aggregate(self.chunk(name), len(providers), len(services)), sign=-1)
+                    stale.append(name)
+            rows = 0
+            for path, (chunks, count, part) in ingested.items():
+                combine(totals, part)
+                sources[path] = {"stamp": found[path], "chunks": chunks, "rows": count}
+                rows += count
+            self.aggregates = totals
+            self._save()
+            for name in stale:
+                shutil.rmtree(self._path("chunks", name), ignore_errors=True)
+            return {
+                "added": [path for path in added if path in ingested],
+                "changed": [path for path in changed if path in ingested],
+                "removed": removed,
+                "failed": [path for path in changed + added if path not in ingested],
+                "rows": rows,
+                "seconds": time.perf_counter() - start,
+            }
+
+    def scan(self, provider=None, service=None):
+        # Drill-downs recompute from the memory-mapped columns
+        providers, services = len(self.manifest["providers"]), len(self.manifest["services"])
+        totals = empty_aggregates(providers, services)
+        provider_code = self.manifest["providers"].index(provider) if provider is not None else None
+        service_code = self.manifest["services"].index(service) if service is not None else None
+        for columns in self.chunks():
+            mask = np.ones(len(columns["start"]), bool)
+            if provider_code is not None:
+                mask &= columns["provider"] == provider_code
+            if service_code is not None:
+                mask &= columns["service"] == service_code
+            combine(totals, aggregate({key: values[mask] for key, values in columns.items()}, providers, services))
+        return totals
+
+def summary(aggregates, providers, services):
+    # A refresh in progress may already have appended names the totals don't cover yet
+    providers = providers[: len(aggregates["provider_bookings"])]
+    services = services[: len(aggregates["service_bookings"])]
+    status = dict(zip(STATUSES, aggregates["status"].tolist()))
+    attended = status["completed"] + status["no_show"]
+    return {
+        "bookings": int(aggregates["status"].sum()),
+        "no_show_rate": status["no_show"] / attended if attended else 0.0,
+        "cancellation_rate": status["cancelled"] / max(1, int(aggregates["status"].sum())),
+        "by_hour": pd.Series(aggregates["hour"], index=[f"{hour:02d}:00" for hour in range(24)]),
+        "by_weekday": pd.Series(aggregates["weekday"], index=WEEKDAYS),
+        "lead_time": pd.Series(aggregates["lead_time"], index=LEAD_TIME_LABELS),
+        "by_provider": pd.DataFrame({
+            "bookings": aggregates["provider_bookings"],
+            "no_show_rate": no_show_rate(aggregates["provider_no_shows"], aggregates["provider_attended"]),
+        }, index=pd.Index(providers, name="provider")),
+        "by_service": pd.DataFrame({
+            "bookings": aggregates["service_bookings"],
+            "no_show_rate": no_show_rate(aggregates["service_no_shows"], aggregates["service_attended"]),
+        }, index=pd.Index(services, name="service")),
+    }
+
+def write_sample_log(path, rows, providers=200, start="2025-01-01", days=365, chunksize=1_000_000, seed=0):
+    rng = np.random.default_rng(seed)
+    first = np.datetime64(start, "m").astype(np.int64)
+    now = first + days * 1440
+    # Opening hours 8:00-18:00 with a lunchtime dip, on a quarter-hour grid
+    hour_weights = np.array([0] * 8 + [6, 9, 10, 9, 5, 7, 9, 9, 8, 6] + [0] * 6, float)
+    hour_weights /= hour_weights.sum()
+    service_weights = rng.dirichlet(np.ones(len(SERVICES)) * 2)
+    provider_weights = rng.pareto(1.5, providers) + 1
+    provider_weights /= provider_weights.sum()
+    jsonl = path.endswith((".jsonl", ".json"))
+    with open(path, "w") as f:
+        if not jsonl:
+            f.write(",".join(LOG_COLUMNS) + "\n")
+        for offset in range(0, rows, chunksize):
+            size = min(chunksize, rows - offset)
+            day = rng.integers(0, days + 30, size)
+            minute = rng.choice(24, size, p=hour_weights) * 60 + rng.integers(0, 4, size) * 15
+            start_at = first + day * 1440 + minute
+            lead = np.minimum(rng.exponential(4 * 1440, size), 120 * 1440).astype(np.int64)
+            booked_at = start_at - lead
+            # Longer lead times are forgotten more often
+            no_show = rng.random(size) < 0.04 + 0.08 * np.minimum(lead / (30 * 1440), 1)
+            cancelled = rng.random(size) < 0.1
+            status = np.where(start_at > now, 0, np.where(cancelled, 3, np.where(no_show, 2, 1)))
+            frame = pd.DataFrame({
+                "appointment_id": np.arange(offset, offset + size),
+                "provider": np.char.add("provider-", rng.choice(providers, size, p=provider_weights).astype(str)),
+                "service": np.array(SERVICES)[rng.choice(len(SERVICES), size, p=service_weights)],
+                "booked_at": np.datetime_as_string(booked_at.astype("datetime64[m]")),
+                "start_at": np.datetime_as_string(start_at.astype("datetime64[m]")),
+                "status": np.array(STATUSES)[status],
+            })
+            if jsonl:
+                frame.to_json(f, orient="records", lines=True)
+            else:
+                frame.to_csv(f, header=False, index=False)
+
+def main(args):
+    parser = argparse.ArgumentParser(prog="app.py analytics", description="Fold appointment logs into the analytics cache.")
+    parser.add_argument("--logs", default=LOG_DIR, help="directory of .csv/.jsonl appointment logs")
+    parser.add_argument("--cache", default=CACHE_DIR)
+    parser.add_argument("--sample", type=int, metavar="ROWS", help="first write a synthetic log of this many rows into --logs")
+    parser.add_argument("--seed", type=int, default=0)
+    options = parser.parse_args(args)
+
+    if options.sample:
+        os.makedirs(options.logs, exist_ok=True)
+        path = os.path.join(options.logs, f"appointments-{options.seed}.csv")
+        start = time.perf_counter()
+        write_sample_log(path, options.sample, seed=options.seed)
+        print(f"Wrote {options.sample:,} rows to {path} in {time.perf_counter() - start:.1f} s")
+    cache = AnalyticsCache(options.cache)
+    changes = cache.refresh(options.logs)
+    print(f"Ingested {changes['rows']:,} rows from {len(changes['added'])} new and {len(changes['changed'])} changed file(s), dropped {len(changes['removed'])}, in {changes['seconds']:.1f} s")
+    for path in changes["failed"]:
+        print(f"  skipped {cache.manifest['failed'][path]['error']}")
+    print(f"Cache holds {cache.rows:,} rows from {len(cache.manifest['sources'])} file(s)")
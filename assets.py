@@ -0,0 +1,121 @@
+import json
+import os
+import threading
+from collections import OrderedDict
+
+ASSETS_DIR = "Assets"
+
+# Upper bound on cached file bytes, shared by every session in the process
+MAX_BYTES = int(os.environ.get("SLOTIN_ASSET_CACHE_BYTES", 64 * 1024 * 1024))
+
+LOADERS = {
+    "bytes": lambda data: data,
+    "text": lambda data: data.decode("utf-8"),
+    "json": lambda data: json.loads(data),
+}
+
+class AssetCache:
+    def __init__(self, max_bytes=MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes_cached = 0
+        self.bytes_read = 0
+
+    def get(self, path, kind="bytes"):
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        version = (stat.st_mtime_ns, stat.st_size)
+        key = (kind, path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+
+        # Read and parse outside the lock so a slow file doesn't block other sessions
+        with open(path, "rb") as f:
+            data = f.read()
+        value = LOADERS[kind](data)
+
+        with self._lock:
+            self.bytes_read += len(data)
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.bytes_cached -= old[1]
+            # Files larger than the whole budget are served but never cached
+            if len(data) <= self.max_bytes:
+                self._entries[key] = (version, len(data), value)
+                self.bytes_cached += len(data)
+                while self.bytes_cached > self.max_bytes:
+                    _, (_, size, _) = self._entries.popitem(last=False)
+                    self.bytes_cached -= size
+                    self.evictions += 1
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes_cached = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "bytes_cached": self.bytes_cached,
+                "bytes_read": self.bytes_read,
+                "max_bytes": self.max_bytes,
+            }
+
+cache = AssetCache()
+
+def load_bytes(path):
+    return cache.get(path, "bytes")
+
+def load_text(path):
+    return cache.get(path, "text")
+
+def load_json(path):
+    return cache.get(path, "json")
+
+def stats():
+    return cache.stats()
+
+def kind_for(path):
+    if path.endswith(".json"):
+        return "json"
+    if path.endswith((".md", ".txt", ".css", ".html", ".svg")):
+        return "text"
+    return "bytes"
+
+def preload(root=ASSETS_DIR):
+    if not os.path.isdir(root):
+        return 0
+    count = 0
+    for dirpath, _, filenames in os.walk(root):
+        for filename in sorted(filenames):
+            path = os.path.join(dirpath, filename)
+            cache.get(path, kind_for(path))
+            count += 1
+    return count
+
+_preloaded = False
+_preload_lock = threading.Lock()
+
+def preload_once():
+    # SLOTIN_PRELOAD_ASSETS=1 warms the cache from Assets/ on the first run in the process
+    global _preloaded
+    if _preloaded or os.environ.get("SLOTIN_PRELOAD_ASSETS") != "1":
+        return
+    with _preload_lock:
+        if not _preloaded:
+            preload()
+            _preloaded = True
@@ -0,0 +1,177 @@
+import threading
+from datetime import datetime, time, timedelta
+
+import numpy as np
+
+SLOT_MINUTES = 15
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES
+DAYS = 365
+
+# find_free scans a day at a time at first, doubling the block up to a
+# month, and stops as soon as it has enough openings
+FIRST_SCAN_BLOCK = SLOTS_PER_DAY
+MAX_SCAN_BLOCK = SLOTS_PER_DAY * 32
+
+class Calendar:
+    # One bit per provider per slot, packed 8 slots to a byte in the same
+    # (big-endian) order np.packbits uses. A year of 15-minute slots costs
+    # 4,380 bytes per provider, plus about 10 bytes per booking for the index.
+    def __init__(self, providers, days=DAYS, start=None):
+        self.providers = providers
+        self.slots = days * SLOTS_PER_DAY
+        self.start = start or datetime.combine(datetime.now().date(), time())
+        self.bits = np.zeros((providers, (self.slots + 7) // 8), dtype=np.uint8)
+        # Every accepted booking as a sorted provider * slots + start key and its
+        # length, so cancelling frees exactly what was booked and never blocked
+        # hours. About 10 bytes per booking instead of a Python dict entry.
+        self.booking_keys = np.zeros(0, dtype=np.int64)
+        self.booking_lengths = np.zeros(0, dtype=np.min_scalar_type(self.slots))
+        self._lock = threading.Lock()
+
+    def nbytes(self):
+        return self.bits.nbytes + self.booking_keys.nbytes + self.booking_lengths.nbytes
+
+    def bytes_per_provider(self):
+        return self.nbytes() / self.providers
+
+    def slot_at(self, moment):
+        return int((moment - self.start) // timedelta(minutes=SLOT_MINUTES))
+
+    def time_of(self, slot):
+        return self.start + timedelta(minutes=SLOT_MINUTES * int(slot))
+
+    def _keys(self, providers, starts):
+        return np.asarray(providers, dtype=np.int64) * self.slots + np.asarray(starts, dtype=np.int64)
+
+    def _cells(self, providers, starts, lengths):
+        # Expands each booking into its (provider, slot) cells without a Python loop
+        providers = np.asarray(providers, dtype=np.int64)
+        starts = np.asarray(starts, dtype=np.int64)
+        lengths = np.asarray(lengths, dtype=np.int64)
+        if ((starts < 0) | (lengths <= 0) | (starts + lengths > self.slots)).any():
+            raise ValueError("bookings must have a positive length and fall inside the calendar")
+        offsets = np.cumsum(lengths) - lengths
+        slots = np.repeat(starts - offsets, lengths) + np.arange(lengths.sum())
+        return np.repeat(providers, lengths), slots, offsets
+
+    def _test(self, cell_providers, slots):
+        return (self.bits[cell_providers, slots >> 3] >> (7 - (slots & 7))) & 1
+
+    def conflicts(self, providers, starts, lengths):
+        cell_providers, slots, offsets = self._cells(providers, starts, lengths)
+        if len(slots) == 0:
+            return np.zeros(0, dtype=bool)
+        return np.logical_or.reduceat(self._test(cell_providers, slots), offsets).astype(bool)
+
+    def is_free(self, provider, start, length):
+        return not self.conflicts([provider], [start], [length])[0]
+
+    def book(self, providers, starts, lengths):
+        # Returns which bookings were accepted. A booking is rejected if it
+        # overlaps the calendar, or a booking earlier in the same batch.
+        with self._lock:
+            cell_providers, slots, offsets = self._cells(providers, starts, lengths)
+            owners = np.repeat(np.arange(len(offsets)), np.asarray(lengths, dtype=np.int64))
+            accepted = np.ones(len(offsets), dtype=bool)
+            accepted[owners[self._test(cell_providers, slots) == 1]] = False
+
+            keep = accepted[owners]
+            keys = cell_providers[keep] * self.slots + slots[keep]
+            _, first = np.unique(keys, return_index=True)
+            duplicate = np.ones(len(keys), dtype=bool)
+            duplicate[first] = False
+            accepted[owners[keep][duplicate]] = False
+
+            keep = accepted[owners]
+            self._set(cell_providers[keep], slots[keep], True)
+            # Accepted bookings occupy free slots, so their keys are new
+            keys = self._keys(providers, starts)[accepted]
+            order = np.argsort(keys, kind="stable")
+            positions = np.searchsorted(self.booking_keys, keys[order])
+            self.booking_keys = np.insert(self.booking_keys, positions, keys[order])
+            self.booking_lengths = np.insert(self.booking_lengths, positions, np.asarray(lengths)[accepted][order])
+            return accepted
+
+    def cancel(self, providers, starts):
+        # Cancels the bookings starting at these slots. Returns each one's
+        # length in slots, 0 where no booking starts there (nothing is freed).
+        providers = np.asarray(providers, dtype=np.int64)
+        starts = np.asarray(starts, dtype=np.int64)
+        valid = (providers >= 0) & (providers < self.providers) & (starts >= 0) & (starts < self.slots)
+        lengths = np.zeros(len(starts), dtype=np.int64)
+        with self._lock:
+            rows = np.flatnonzero(valid)
+            keys = self._keys(providers[rows], starts[rows])
+            index = np.searchsorted(self.booking_keys, keys)
+            hit = index < len(self.booking_keys)
+            hit[hit] = self.booking_keys[index[hit]] == keys[hit]
+            # A booking named twice in one batch is only cancelled once
+            index, first = np.unique(index[hit], return_index=True)
+            rows = rows[hit][first]
+            lengths[rows] = self.booking_lengths[index]
+            self.booking_keys = np.delete(self.booking_keys, index)
+            self.booking_lengths = np.delete(self.booking_lengths, index)
+            found = lengths > 0
+            if found.any():
+                cell_providers, slots, _ = self._cells(providers[found], starts[found], lengths[found])
+                self._set(cell_providers, slots, False)
+        return lengths
+
+    def _set(self, cell_providers, slots, busy):
+        masks = (0x80 >> (slots & 7)).astype(np.uint8)
+        index = (cell_providers, slots >> 3)
+        if busy:
+            np.bitwise_or.at(self.bits, index, masks)
+        else:
+            np.bitwise_and.at(self.bits, index, ~masks)
+
+    def block_outside_hours(self, open_hour=9, close_hour=17):
+        day = np.ones(SLOTS_PER_DAY, dtype=np.uint8)
+        day[open_hour * 60 // SLOT_MINUTES:close_hour * 60 // SLOT_MINUTES] = 0
+        pattern = np.packbits(np.tile(day, self.slots // SLOTS_PER_DAY + 1)[:self.slots])
+        with self._lock:
+            self.bits |= pattern
+
+    def find_free(self, length, count, start=0, end=None, providers=None):
+        # First `count` (slot, provider) openings of `length` slots, earliest
+        # first, across all providers or the given subset.
+        end = self.slots if end is None else min(end, self.slots)
+        rows = np.arange(self.providers) if providers is None else np.asarray(providers)
+        found_slots, found_providers = [], []
+        found = 0
+        block_start, block = start, FIRST_SCAN_BLOCK
+        while block_start <= end - length:
+            block_end = min(block_start + block + length - 1, end)
+            first_byte = block_start >> 3
+            busy = np.unpackbits(self.bits[rows, first_byte:(block_end + 7) >> 3], axis=1)
+            busy = busy[:, block_start - first_byte * 8:block_end - first_byte * 8]
+
+            # A window is free when the busy count over it is zero
+            totals = np.zeros((len(rows), busy.shape[1] + 1), dtype=np.int16)
+            np.cumsum(busy, axis=1, dtype=np.int16, out=totals[:, 1:])
+            free = (totals[:, length:] - totals[:, :-length]) == 0
+
+            # Transposing orders hits by time, then by provider
+            offsets, indices = np.nonzero(free.T)
+            take = min(count - found, len(offsets))
+            found_slots.append(offsets[:take] + block_start)
+            found_providers.append(rows[indices[:take]])
+            found += take
+            if found >= count:
+                break
+            block_start += block
+            block = min(block * 2, MAX_SCAN_BLOCK)
+        if not found_slots:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        return np.concatenate(found_slots), np.concatenate(found_providers)
+
+def random_bookings(calendar, count, max_length=4, open_hour=9, close_hour=17, seed=0):
+    # Bookings inside working hours, for demos and benchmarks
+    rng = np.random.default_rng(seed)
+    open_slot = open_hour * 60 // SLOT_MINUTES
+    close_slot = close_hour * 60 // SLOT_MINUTES
+    days = rng.integers(0, calendar.slots // SLOTS_PER_DAY, count)
+    lengths = rng.integers(1, max_length + 1, count)
+    offsets = rng.integers(open_slot, close_slot - lengths + 1)
+    providers = rng.integers(0, calendar.providers, count)
+    return providers, days * SLOTS_PER_DAY + offsets, lengths
@@ -0,0 +1,72 @@
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import analytics
+import sysinfo
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ingest, time-to-first-chart and incremental updates of the analytics cache.")
+    parser.add_argument("--rows", type=int, default=50_000_000)
+    parser.add_argument("--files", type=int, default=10, help="split the initial rows across this many log files")
+    parser.add_argument("--increment", type=int, default=1_000_000, help="rows in the log file added afterwards")
+    parser.add_argument("--dir", help="work directory (default: a temporary one, removed afterwards)")
+    options = parser.parse_args()
+
+    work = options.dir or tempfile.mkdtemp(prefix="slotin-analytics-")
+    logs, cache_dir = os.path.join(work, "logs"), os.path.join(work, "cache")
+    os.makedirs(logs, exist_ok=True)
+    try:
+        per_file = -(-options.rows // options.files)
+        start = time.perf_counter()
+        for i in range(options.files):
+            path = os.path.join(logs, f"appointments-{i:03d}.csv")
+            if not os.path.exists(path):
+                analytics.write_sample_log(path, min(per_file, options.rows - i * per_file), seed=i)
+        log_bytes = sum(entry.stat().st_size for entry in os.scandir(logs))
+        print(f"{options.rows:,} rows in {options.files} CSV files ({log_bytes / 2**30:.1f} GiB), generated in {time.perf_counter() - start:.0f} s")
+
+        cache = analytics.AnalyticsCache(cache_dir)
+        changes, seconds = timed(cache.refresh, logs)
+        cache_bytes = sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(cache_dir) for name in names)
+        print(f"  first ingest: {changes['rows']:,} rows in {seconds:.1f} s ({changes['rows'] / max(seconds, 1e-9):,.0f} rows/s), cache {cache_bytes / 2**20:,.0f} MiB")
+
+        # What a new server process does before its first chart
+        def first_chart():
+            reopened = analytics.AnalyticsCache(cache_dir)
+            reopened.refresh(logs)
+            return analytics.summary(reopened.aggregates, reopened.manifest["providers"], reopened.manifest["services"])
+
+        summary, seconds = timed(first_chart)
+        print(f"  time to first chart: {seconds * 1000:.1f} ms for {summary['bookings']:,} rows")
+
+        provider = cache.manifest["providers"][0]
+        _, seconds = timed(cache.scan, provider)
+        print(f"  drill-down scan for {provider}: {seconds:.2f} s ({cache.rows / seconds:,.0f} rows/s)")
+        _, seconds = timed(cache.scan, None, analytics.SERVICES[0])
+        print(f"  drill-down scan for {analytics.SERVICES[0]}: {seconds:.2f} s ({cache.rows / seconds:,.0f} rows/s)")
+
+        path = os.path.join(logs, "appointments-increment.csv")
+        analytics.write_sample_log(path, options.increment, seed=options.files)
+        changes, seconds = timed(cache.refresh, logs)
+        print(f"  incremental ingest: {changes['rows']:,} new rows in {seconds:.2f} s, history untouched")
+        os.remove(path)
+        changes, seconds = timed(cache.refresh, logs)
+        print(f"  dropping that file again: {seconds * 1000:.0f} ms")
+        print(f"  RSS {sysinfo.current_rss() / 2**20:,.0f} MiB")
+    finally:
+        if not options.dir:
+            shutil.rmtree(work, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
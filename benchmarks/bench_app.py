@@ -0,0 +1,196 @@
+import argparse
+import gc
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from streamlit.testing.v1 import AppTest
+
+import sysinfo
+from views import PAGES
+
+APP = os.path.join(ROOT, "app.py")
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline_app.json")
+
+# Differences smaller than these are noise on a shared box, whatever the ratio
+MIN_DELTA_MS = 10.0
+MIN_DELTA_KIB = 64.0
+
+# Per-session memory at a handful of sessions is mostly allocator noise, so
+# smaller counts are reported but never fail the run
+GATED_SESSIONS = 50
+
+# AppTest rescans every installed package for custom components on each new
+# session; a real server does that once per process, so share one registry
+_components = {}
+
+def session(page=None, timeout=120):
+    at = AppTest.from_file(APP, default_timeout=timeout)
+    at._bidi_component_manager = _components.get("manager")
+    if page is not None:
+        at.query_params["page"] = page
+    return at
+
+def timed_run(at):
+    start = time.perf_counter()
+    at.run()
+    seconds = time.perf_counter() - start
+    _components.setdefault("manager", at._bidi_component_manager)
+    if at.exception:
+        raise RuntimeError(f"{at.query_params.get('page')}: {at.exception[0].message}")
+    return seconds * 1000
+
+def cold(page):
+    # Runs in a fresh interpreter so the page module and its imports are not loaded yet.
+    # A throwaway script warms Streamlit's own lazy imports so they aren't charged to the page.
+    warmup = AppTest.from_string("import streamlit as st\nst.sidebar.radio('x', ['x'])\nst.markdown('x')")
+    warmup.run()
+    _components["manager"] = warmup._bidi_component_manager
+    return timed_run(session(page))
+
+def warm(page, repeats):
+    at = session(page)
+    timed_run(at)
+    return [timed_run(at) for _ in range(repeats)]
+
+def switches(pages, repeats):
+    # Each sample is a switch into the page from the one before it in the list
+    at = session(pages[-1])
+    timed_run(at)
+    timings = {page: [] for page in pages}
+    for _ in range(repeats):
+        for page in pages:
+            at.sidebar.radio[0].set_value(page)
+            timings[page].append(timed_run(at))
+    return timings
+
+def session_memory(count, pages):
+    # Render every page once first so imports and shared caches aren't charged to the sessions.
+    # tracemalloc counts the Python heap exactly; RSS also moves with the allocator, so it is
+    # reported but not compared.
+    for page in pages:
+        timed_run(session(page))
+    gc.collect()
+    tracemalloc.start()
+    before, rss_before = tracemalloc.get_traced_memory()[0], sysinfo.current_rss()
+    sessions = []
+    for i in range(count):
+        at = session(pages[i % len(pages)])
+        at.run()
+        sessions.append(at)
+    gc.collect()
+    traced = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return {"traced_kib": traced / count / 1024, "rss_kib": (sysinfo.current_rss() - rss_before) / count / 1024}
+
+def in_subprocess(*args):
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), *args],
+        check=True, capture_output=True, text=True, cwd=ROOT,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def measure(pages, repeats, cold_repeats, session_counts, memory_repeats):
+    # Best of N: noise on a shared box only ever adds time
+    results = {"pages": {}, "sessions": {}}
+    switched = switches(pages, repeats)
+    for page in pages:
+        results["pages"][page] = {
+            "cold_ms": min(in_subprocess("--cold", page) for _ in range(cold_repeats)),
+            "warm_ms": min(warm(page, repeats)),
+            "switch_ms": min(switched[page]),
+        }
+        print(f"  {page:<26} cold {results['pages'][page]['cold_ms']:>8.1f}  warm {results['pages'][page]['warm_ms']:>8.1f}  switch {results['pages'][page]['switch_ms']:>8.1f} ms")
+    for count in session_counts:
+        runs = [in_subprocess("--session-memory", str(count), "--pages", ",".join(pages)) for _ in range(memory_repeats)]
+        traced = statistics.median(run["traced_kib"] for run in runs)
+        rss = statistics.median(run["rss_kib"] for run in runs)
+        results["sessions"][str(count)] = {"traced_kib_per_session": traced, "rss_kib_per_session": rss}
+        gated = "" if count >= GATED_SESSIONS else "  (not gated)"
+        print(f"  {count:>4} sessions: {traced:,.0f} KiB traced, {rss:,.0f} KiB RSS per session{gated}")
+    return results
+
+def regressions(results, baseline, threshold):
+    failures = []
+
+    def check(label, current, previous, floor, unit):
+        if previous is None:
+            return
+        if current > previous * (1 + threshold) and current - previous > floor:
+            failures.append(f"{label}: {current:,.1f} {unit} vs baseline {previous:,.1f} {unit} (+{current / previous - 1:.0%})")
+
+    for page, metrics in results["pages"].items():
+        previous = baseline.get("pages", {}).get(page, {})
+        for key, value in metrics.items():
+            check(f"{page} {key[:-3]}", value, previous.get(key), MIN_DELTA_MS, "ms")
+    for count, metrics in results["sessions"].items():
+        if int(count) < GATED_SESSIONS:
+            continue
+        previous = baseline.get("sessions", {}).get(count, {})
+        check(f"{count} sessions", metrics["traced_kib_per_session"], previous.get("traced_kib_per_session"), MIN_DELTA_KIB, "KiB/session")
+    return failures
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark every page headlessly with AppTest and compare against a stored baseline.")
+    parser.add_argument("--pages", help="comma-separated page names (default: every page)")
+    parser.add_argument("--repeats", type=int, default=5, help="warm reruns and page-switch rounds per page")
+    parser.add_argument("--cold-repeats", type=int, default=3, help="fresh interpreters per page for the cold render")
+    parser.add_argument("--sessions", default="1,50,500", help=f"simulated session counts for the memory check (only {GATED_SESSIONS} and up can fail the run)")
+    parser.add_argument("--memory-repeats", type=int, default=3, help="fresh interpreters per session count; the median is kept")
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--threshold", type=float, default=0.5, help="allowed slowdown before failing, as a fraction of the baseline")
+    parser.add_argument("--update-baseline", action="store_true", help="write this run's results as the new baseline")
+    parser.add_argument("--cold", help=argparse.SUPPRESS)
+    parser.add_argument("--session-memory", type=int, help=argparse.SUPPRESS)
+    options = parser.parse_args()
+
+    pages = options.pages.split(",") if options.pages else list(PAGES)
+    unknown = [page for page in pages if page not in PAGES]
+    if unknown:
+        parser.error(f"unknown page(s): {', '.join(unknown)}")
+
+    # Child modes, run in a fresh interpreter by measure()
+    if options.cold:
+        print(json.dumps(cold(options.cold)))
+        return
+    if options.session_memory:
+        print(json.dumps(session_memory(options.session_memory, pages)))
+        return
+
+    results = measure(pages, options.repeats, options.cold_repeats, [int(count) for count in options.sessions.split(",")], options.memory_repeats)
+    results["machine"] = {"python": sys.version.split()[0], "cpus": os.cpu_count()}
+
+    if options.update_baseline:
+        with open(options.baseline, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"Baseline written to {options.baseline}")
+        return
+
+    try:
+        with open(options.baseline) as f:
+            baseline = json.load(f)
+    except FileNotFoundError:
+        print(f"No baseline at {options.baseline}; run with --update-baseline first.")
+        sys.exit(2)
+
+    if baseline.get("machine") != results["machine"]:
+        print(f"Warning: baseline was recorded on {baseline.get('machine')}, this run is {results['machine']}")
+
+    failures = regressions(results, baseline, options.threshold)
+    if failures:
+        print(f"{len(failures)} regression(s) beyond {options.threshold:.0%}:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print(f"No regressions beyond {options.threshold:.0%} against {options.baseline}")
+
+if __name__ == "__main__":
+    main()
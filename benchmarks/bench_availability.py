@@ -0,0 +1,65 @@
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import availability
+
+def timed(func, *args, repeats=1):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func(*args)
+        timings.append(time.perf_counter() - start)
+    return result, statistics.median(timings)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the slot-availability engine.")
+    parser.add_argument("--providers", type=int, default=10_000)
+    parser.add_argument("--days", type=int, default=availability.DAYS)
+    parser.add_argument("--bookings", type=int, default=2_000_000)
+    options = parser.parse_args()
+
+    calendar, seconds = timed(availability.Calendar, options.providers, options.days)
+    print(f"{options.providers:,} providers x {calendar.slots:,} slots of {availability.SLOT_MINUTES} min")
+    print(f"  calendar memory: {calendar.nbytes() / 2**20:.1f} MiB ({calendar.bytes_per_provider():,.0f} bytes/provider), allocated in {seconds * 1000:.1f} ms")
+
+    _, seconds = timed(calendar.block_outside_hours)
+    print(f"  block outside 9-17h: {seconds * 1000:.1f} ms")
+
+    providers, starts, lengths = availability.random_bookings(calendar, options.bookings)
+    accepted, seconds = timed(calendar.book, providers, starts, lengths)
+    print(f"  bulk book {options.bookings:,}: {seconds:.2f} s ({options.bookings / seconds:,.0f}/s), {accepted.sum():,} accepted")
+    print(f"  memory with bookings: {calendar.nbytes() / 2**20:.1f} MiB ({calendar.bytes_per_provider():,.0f} bytes/provider, booking index included)")
+
+    cancel = np.flatnonzero(accepted)[: options.bookings // 10]
+    _, seconds = timed(calendar.cancel, providers[cancel], starts[cancel])
+    print(f"  bulk cancel {len(cancel):,}: {seconds:.2f} s ({len(cancel) / seconds:,.0f}/s)")
+
+    _, seconds = timed(calendar.is_free, 123, 5000, 4, repeats=1000)
+    print(f"  single conflict check: {seconds * 1e6:.1f} us")
+
+    checks = 100_000
+    sample = np.random.default_rng(1).integers(0, options.bookings, checks)
+    _, seconds = timed(calendar.conflicts, providers[sample], starts[sample], lengths[sample], repeats=5)
+    print(f"  bulk conflict check {checks:,}: {seconds * 1000:.1f} ms ({checks / seconds:,.0f}/s)")
+
+    print(f"  {'query':<44} {'median (ms)':>12}")
+    day = availability.SLOTS_PER_DAY
+    queries = [
+        ("first 10 x 1h slots, all providers, today", (4, 10, 0)),
+        ("first 100 x 30min slots, all providers, +90d", (2, 100, 90 * day)),
+        ("first 10 x 2h slots, 100 providers", (8, 10, 0, None, np.arange(100))),
+        ("first 1000 x 15min slots, all providers", (1, 1000, 0)),
+    ]
+    for label, args in queries:
+        _, seconds = timed(calendar.find_free, *args, repeats=5)
+        print(f"  {label:<44} {seconds * 1000:>12.2f}")
+
+if __name__ == "__main__":
+    main()
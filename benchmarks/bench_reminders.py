@@ -0,0 +1,84 @@
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import reminders
+from sysinfo import current_rss
+
+DAY = 24 * 3600
+
+def rate(count, seconds):
+    return f"{count / seconds:>12,.0f}/s" if seconds else f"{'-':>14}"
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+def bench_wheel(pending, ops, dues, extra_dues):
+    rss = current_rss()
+    wheel = reminders.TimingWheel(resolution=60.0)
+    _, seconds = timed(lambda: [wheel.schedule(id, due) for id, due in enumerate(dues.tolist())])
+    print(f"  timing wheel: load {pending:,} {rate(pending, seconds)}, {(current_rss() - rss) / pending:.0f} bytes/reminder")
+
+    extra = range(pending, pending + ops)
+    _, seconds = timed(lambda: [wheel.schedule(id, due) for id, due in zip(extra, extra_dues.tolist())])
+    print(f"    insert      {rate(ops, seconds)}")
+    _, seconds = timed(lambda: [wheel.reschedule(id, due + 3600) for id, due in zip(extra, extra_dues.tolist())])
+    print(f"    reschedule  {rate(ops, seconds)}")
+    _, seconds = timed(lambda: [wheel.cancel(id) for id in extra])
+    print(f"    cancel      {rate(ops, seconds)}")
+    fired, seconds = timed(lambda: wheel.advance(DAY))
+    print(f"    fire 1 day  {rate(len(fired), seconds)} ({len(fired):,} reminders in {seconds * 1000:.0f} ms)")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "reminders.snapshot")
+        _, seconds = timed(lambda: wheel.snapshot(path))
+        size = os.path.getsize(path)
+        print(f"    snapshot    {seconds:.2f} s, {size / 2**20:.0f} MiB")
+        del wheel
+        gc.collect()
+        _, seconds = timed(lambda: reminders.TimingWheel.restore(path))
+        print(f"    restore     {seconds:.2f} s")
+
+def bench_sorted_list(pending, ops, dues, extra_dues):
+    scheduler = reminders.SortedListScheduler()
+    # Loaded with one sort; inserting a million reminders one by one would take hours
+    _, seconds = timed(lambda: scheduler.load(range(pending), dues.tolist()))
+    print(f"  sorted list: load {pending:,} by sorting in {seconds:.2f} s")
+
+    extra = range(pending, pending + ops)
+    _, seconds = timed(lambda: [scheduler.schedule(id, due) for id, due in zip(extra, extra_dues.tolist())])
+    print(f"    insert      {rate(ops, seconds)}")
+    _, seconds = timed(lambda: [scheduler.cancel(id) for id in extra])
+    print(f"    cancel      {rate(ops, seconds)}")
+    fired, seconds = timed(lambda: scheduler.advance(DAY))
+    print(f"    fire 1 day  {rate(len(fired), seconds)} ({len(fired):,} reminders in {seconds * 1000:.0f} ms)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the reminder timing wheel against a sorted list.")
+    parser.add_argument("--pending", type=lambda value: [int(part) for part in value.split(",")], default=[1_000_000, 10_000_000])
+    parser.add_argument("--ops", type=int, default=100_000, help="inserts/cancels measured on top of the pending reminders")
+    parser.add_argument("--naive-ops", type=int, default=10_000)
+    parser.add_argument("--days", type=int, default=30, help="reminders are spread over this many days")
+    options = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    for pending in options.pending:
+        print(f"{pending:,} pending reminders over {options.days} days")
+        dues = rng.uniform(0, options.days * DAY, pending)
+        extra_dues = rng.uniform(0, options.days * DAY, options.ops)
+        bench_wheel(pending, options.ops, dues, extra_dues)
+        gc.collect()
+        bench_sorted_list(pending, options.naive_ops, dues, extra_dues[: options.naive_ops])
+        gc.collect()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import search
+
+QUERIES = ["redis queue", "reminder", "privacy", "calen", "roadmap phase", "appointment booking", "x"]
+
+def grow(docs, factor):
+    # Copies get a unique token each so the vocabulary grows with the corpus
+    grown = []
+    for copy in range(factor):
+        for doc in docs:
+            grown.append(dict(doc, text=f"{doc['text']} copy{copy}"))
+    return grown
+
+def main():
+    base = search.corpus()
+    print(f"{'docs':>8} {'terms':>8} {'build (ms)':>12} {'query p50 (us)':>16} {'query p99 (us)':>16}")
+    for factor in (1, 10, 100, 1000):
+        docs = grow(base, factor)
+        start = time.perf_counter()
+        index = search.SearchIndex(docs)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        timings = []
+        for _ in range(200):
+            for query in QUERIES:
+                start = time.perf_counter()
+                index.search(query, limit=10)
+                timings.append((time.perf_counter() - start) * 1e6)
+        timings.sort()
+        p50 = statistics.median(timings)
+        p99 = timings[int(len(timings) * 0.99)]
+        print(f"{len(docs):>8} {len(index.terms):>8} {build_ms:>12.1f} {p50:>16.1f} {p99:>16.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import copy
+import math
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.datasets import make_classification
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.metrics import accuracy_score
+from sklearn.model_selection import train_test_split
+
+APPOINTMENT_TYPES = ["consultation", "check_up", "follow_up", "procedure", "therapy", "emergency", "vaccination", "diagnostics"]
+
+BATCH_SIZES = [1, 100, 10_000, 1_000_000]
+
+def feature_names(features):
+    return [f"feature{i}" for i in range(1, features + 1)]
+
+def informative_features(features, classes):
+    # make_classification needs 2**n_informative >= classes
+    return min(features, max(2, features * 3 // 4, math.ceil(math.log2(classes))))
+
+def max_classes(features):
+    return min(len(APPOINTMENT_TYPES), 2 ** informative_features(features, len(APPOINTMENT_TYPES)))
+
+def make_appointments(rows=20_000, features=8, classes=4, seed=42):
+    classes = min(classes, max_classes(features))
+    X, y = make_classification(
+        n_samples=rows,
+        n_features=features,
+        n_informative=informative_features(features, classes),
+        n_redundant=0,
+        n_classes=classes,
+        n_clusters_per_class=1,
+        random_state=seed,
+    )
+    data = pd.DataFrame(X.astype(np.float32), columns=feature_names(features))
+    data["appointment_type"] = np.asarray(APPOINTMENT_TYPES[:classes])[y]
+    return data
+
+def train(rows=20_000, features=8, classes=4, n_estimators=50, n_jobs=-1, seed=42):
+    data = make_appointments(rows, features, classes, seed)
+    columns = feature_names(features)
+    X_train, X_test, y_train, y_test = train_test_split(
+        data[columns].to_numpy(), data["appointment_type"].to_numpy(), test_size=0.2, random_state=seed
+    )
+
+    model = RandomForestClassifier(n_estimators=n_estimators, n_jobs=n_jobs, random_state=seed)
+    start = time.perf_counter()
+    model.fit(X_train, y_train)
+    fit_seconds = time.perf_counter() - start
+
+    return {
+        "model": model,
+        "features": columns,
+        "classes": len(model.classes_),
+        "fit_seconds": fit_seconds,
+        "accuracy": accuracy_score(y_test, model.predict(X_test)),
+        "train_rows": len(X_train),
+    }
+
+def single_row_latency(model, features, repeats=50, seed=0):
+    # Dispatching one row to a thread pool costs more than predicting it, so
+    # real-time calls use a single-threaded view of the shared model.
+    model = copy.copy(model)
+    model.set_params(n_jobs=1)
+    row = np.random.default_rng(seed).standard_normal((1, features), dtype=np.float32)
+    model.predict(row)
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        model.predict(row)
+        timings.append(time.perf_counter() - start)
+    return float(np.median(timings))
+
+def batch_throughput(model, features, batch_sizes=BATCH_SIZES, seed=0):
+    rng = np.random.default_rng(seed)
+    results = []
+    for size in batch_sizes:
+        X = rng.standard_normal((size, features), dtype=np.float32)
+        start = time.perf_counter()
+        model.predict(X)
+        seconds = time.perf_counter() - start
+        results.append({"batch_size": size, "seconds": seconds, "rows_per_sec": size / seconds})
+    return results
@@ -0,0 +1,19 @@
+import streamlit as st
+import assets
+
+# Optional Streamlit components are heavy to import, so they are loaded on
+# first use by the page that needs them instead of at app start.
+
+def option_menu(*args, **kwargs):
+    from streamlit_option_menu import option_menu
+    return option_menu(*args, **kwargs)
+
+def st_lottie(*args, **kwargs):
+    from streamlit_lottie import st_lottie
+    return st_lottie(*args, **kwargs)
+
+def lottie_file(file_path, **kwargs):
+    return st_lottie(assets.load_json(file_path), **kwargs)
+
+def image(file_path, **kwargs):
+    return st.image(assets.load_bytes(file_path), **kwargs)
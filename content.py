@@ -0,0 +1,121 @@
+import hashlib
+import os
+import re
+import threading
+from collections import namedtuple
+from types import MappingProxyType
+
+import streamlit as st
+import yaml
+
+import assets
+from recorder import slugify
+
+# One markdown file per page, named after its module in views/ (views/faqs.py -> content/faqs.md)
+CONTENT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "content")
+
+FRONT_MATTER = re.compile(r"\A---\n(.*?)\n---\n", re.S)
+COMMENT = re.compile(r"<!--.*?-->\n*", re.S)
+FENCE = re.compile(r"^\s*(```|~~~)")
+
+Section = namedtuple("Section", ["heading", "anchor", "body"])
+Page = namedtuple("Page", ["title", "intro", "sections", "meta", "version"])
+
+def content_hash(text):
+    return hashlib.sha256(text.encode()).hexdigest()[:12]
+
+def parse(text):
+    # Front matter holds page settings; each "## " heading starts a section
+    version = content_hash(text)
+    meta = {}
+    match = FRONT_MATTER.match(text)
+    if match:
+        meta = yaml.safe_load(match.group(1)) or {}
+        text = text[match.end():]
+    text = COMMENT.sub("", text)
+
+    intro, sections = [], []
+    heading, lines, fenced = None, intro, False
+    for line in text.splitlines():
+        if FENCE.match(line):
+            fenced = not fenced
+        if line.startswith("## ") and not fenced:
+            if heading is not None:
+                sections.append(Section(heading, slugify(heading), "\n".join(lines).strip()))
+            heading, lines = line[3:].strip(), []
+            continue
+        lines.append(line)
+    if heading is not None:
+        sections.append(Section(heading, slugify(heading), "\n".join(lines).strip()))
+    return Page(meta.pop("title", ""), "\n".join(intro).strip(), tuple(sections), MappingProxyType(meta), version)
+
+class ContentStore:
+    def __init__(self, root=CONTENT_DIR):
+        self.root = root
+        self._lock = threading.Lock()
+        self._pages = {}
+        self.parses = 0
+
+    def path(self, slug):
+        return os.path.join(self.root, slug + ".md")
+
+    def slugs(self):
+        return sorted(name[:-3] for name in os.listdir(self.root) if name.endswith(".md"))
+
+    def page(self, slug):
+        # assets re-reads the file only when its mtime or size changes, and hands
+        # back the same string until then, so the usual path is one stat call
+        text = assets.load_text(self.path(slug))
+        entry = self._pages.get(slug)
+        if entry is not None and entry[0] is text:
+            return entry[1]
+        page = entry[1] if entry is not None and entry[1].version == content_hash(text) else None
+        if page is None:
+            page = parse(text)
+            self.parses += 1
+        with self._lock:
+            self._pages[slug] = (text, page)
+        return page
+
+    def version(self):
+        # Changes whenever any page does; keys caches built from all content
+        digest = hashlib.sha256()
+        for slug in self.slugs():
+            digest.update(self.page(slug).version.encode())
+        return digest.hexdigest()[:12]
+
+    def stats(self):
+        with self._lock:
+            return {"pages": {slug: entry[1].version for slug, entry in self._pages.items()}, "parses": self.parses}
+
+store = ContentStore()
+
+def page(slug):
+    return store.page(slug)
+
+def version():
+    return store.version()
+
+def render_section(slug, section, collapsed):
+    # A deep link (?section=...) shows its section open under an anchored heading
+    if not collapsed or st.query_params.get("section") == section.anchor:
+        st.subheader(section.heading, anchor=section.anchor)
+        if section.body:
+            st.write(section.body)
+        return
+    # The body is only sent once the viewer opens the section
+    expander = st.expander(section.heading, on_change="rerun", key=f"content-{slug}-{section.anchor}")
+    if expander.open:
+        with expander:
+            st.write(section.body)
+
+def render(slug):
+    page = store.page(slug)
+    st.title(page.title)
+    if page.intro:
+        st.write(page.intro)
+    for section in page.sections:
+        render_section(slug, section, page.meta.get("collapsed", False))
+    button = page.meta.get("button")
+    if button and st.button(button["label"]):
+        st.markdown(f'<a href="{button["link"]}" target="_blank">{button["text"]}</a>', unsafe_allow_html=True)
@@ -0,0 +1,212 @@
+import argparse
+import gzip
+import hashlib
+import html
+import importlib.util
+import json
+import os
+from urllib.parse import quote_plus
+
+from markdown_it import MarkdownIt
+
+import content
+import recorder
+from recorder import record_page, slugify
+from views import PAGES, LIVE_PAGES, has_demo
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Bump when the HTML output changes so every page is re-rendered
+EXPORT_VERSION = "1"
+
+MANIFEST = ".export-manifest.json"
+
+# Every page's HTML also depends on these, so editing them re-renders the site
+RENDERER_SOURCES = [os.path.abspath(__file__), recorder.__file__, content.__file__]
+
+# CommonMark with GFM tables and strikethrough, like Streamlit's own markdown;
+# a list may follow a paragraph line without a blank line in between
+MARKDOWN = MarkdownIt("commonmark").enable(["table", "strikethrough"])
+
+PAGE_TEMPLATE = """<!doctype html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title} - Slotin Docs</title>
+<link rel="stylesheet" href="style.css">
+</head>
+<body>
+<nav class="sidebar">
+<h2>Navigation</h2>
+<ul>
+{nav}
+</ul>
+</nav>
+<main>
+{body}
+</main>
+</body>
+</html>
+"""
+
+STYLE = """body { margin: 0; display: flex; font-family: "Source Sans Pro", sans-serif; line-height: 1.6; color: #31333f; }
+.sidebar { width: 15rem; min-height: 100vh; padding: 2rem 1rem; background: #f0f2f6; flex-shrink: 0; }
+.sidebar ul { list-style: none; padding: 0; }
+.sidebar a { color: inherit; text-decoration: none; }
+.sidebar a.active { font-weight: bold; }
+main { max-width: 46rem; padding: 2rem 3rem; }
+pre { background: #f0f2f6; padding: 1rem; overflow-x: auto; }
+.caption { color: #808495; font-size: 0.875rem; }
+"""
+
+def page_file(name):
+    if name == next(iter(PAGES)):
+        return "index.html"
+    return slugify(name) + ".html"
+
+def page_sources(name):
+    module = PAGES[name]
+    sources = [importlib.util.find_spec(module).origin]
+    # Pages whose text lives in the content store re-render when it changes
+    path = content.store.path(module.rsplit(".", 1)[1])
+    if os.path.exists(path):
+        sources.append(path)
+    return sources
+
+def source_key(name, nav):
+    digest = hashlib.sha256()
+    digest.update(EXPORT_VERSION.encode())
+    digest.update(PAGE_TEMPLATE.encode())
+    digest.update(nav.encode())
+    digest.update(name.encode())
+    digest.update(str(name in LIVE_PAGES).encode())
+    for path in RENDERER_SOURCES + page_sources(name):
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+def render_markdown(text):
+    return MARKDOWN.render(text)
+
+def render_element(element):
+    kind = element["type"]
+    body = element.get("body", "")
+    if kind == "title":
+        return f"<h1>{html.escape(body)}</h1>"
+    if kind == "header":
+        return f'<h2 id="{slugify(body)}">{html.escape(body)}</h2>'
+    if kind == "subheader":
+        return f'<h3 id="{slugify(body)}">{html.escape(body)}</h3>'
+    if kind in ("write", "markdown"):
+        return render_markdown(body)
+    if kind == "code":
+        language = element.get("language", "python")
+        return f'<pre><code class="language-{language}">{html.escape(body)}</code></pre>'
+    if kind == "caption":
+        return f'<p class="caption">{html.escape(body)}</p>'
+    if kind == "text":
+        return f"<pre>{html.escape(body)}</pre>"
+    if kind == "divider":
+        return "<hr>"
+    if kind == "image" and isinstance(body, str):
+        caption = html.escape(element.get("caption", ""))
+        return f'<figure><img src="{html.escape(body)}" alt="{caption}"><figcaption>{caption}</figcaption></figure>'
+    return ""
+
+def live_link(name, live_url):
+    if not live_url:
+        return ""
+    link = html.escape(f"{live_url}?page={quote_plus(name)}")
+    return f'\n<p><a href="{link}">Open {html.escape(name)} in the live app</a></p>'
+
+def render_live_stub(name, live_url):
+    return f"<h1>{html.escape(name)}</h1>\n<p>This page is interactive and only runs in the live app.</p>" + live_link(name, live_url)
+
+def render_page(name, nav, live_url):
+    if name in LIVE_PAGES:
+        body = render_live_stub(name, live_url)
+        title = name
+    else:
+        elements = record_page(name)
+        body = "\n".join(render_element(element) for element in elements)
+        title = next((e["body"] for e in elements if e["type"] == "title"), name)
+        if has_demo(name):
+            body += "\n<p>This page also has an interactive demo in the live app.</p>" + live_link(name, live_url)
+    active = f'<li><a href="{page_file(name)}">'
+    nav = nav.replace(active, f'<li><a class="active" href="{page_file(name)}">')
+    return PAGE_TEMPLATE.format(title=html.escape(title), nav=nav, body=body)
+
+def render_nav():
+    return "\n".join(f'<li><a href="{page_file(name)}">{html.escape(name)}</a></li>' for name in PAGES)
+
+def etag(data):
+    return '"' + hashlib.sha256(data).hexdigest()[:16] + '"'
+
+def write_variants(out_dir, filename, data):
+    # Precompressed siblings let nginx gzip_static/brotli_static serve them directly
+    variants = {filename: data, filename + ".gz": gzip.compress(data, 9, mtime=0)}
+    if brotli is not None:
+        variants[filename + ".br"] = brotli.compress(data, quality=11)
+    etags = {}
+    for variant, payload in variants.items():
+        with open(os.path.join(out_dir, variant), "wb") as f:
+            f.write(payload)
+        etags[variant] = etag(payload)
+    return etags
+
+def load_manifest(out_dir):
+    try:
+        with open(os.path.join(out_dir, MANIFEST)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"pages": {}, "etags": {}}
+
+def export(out_dir, force=False, live_url=None):
+    os.makedirs(out_dir, exist_ok=True)
+    manifest = load_manifest(out_dir)
+    pages, etags = manifest["pages"], manifest["etags"]
+    nav = render_nav()
+    rendered, skipped = [], []
+
+    etags.update(write_variants(out_dir, "style.css", STYLE.encode()))
+
+    for name in PAGES:
+        filename = page_file(name)
+        key = source_key(name, nav)
+        previous = pages.get(name)
+        if not force and previous == {"key": key, "file": filename} and os.path.exists(os.path.join(out_dir, filename)):
+            skipped.append(name)
+            continue
+        data = render_page(name, nav, live_url).encode()
+        etags.update(write_variants(out_dir, filename, data))
+        pages[name] = {"key": key, "file": filename}
+        rendered.append(name)
+
+    # Drop output for pages that were removed from the registry
+    for name in [name for name in pages if name not in PAGES]:
+        filename = pages.pop(name)["file"]
+        for variant in (filename, filename + ".gz", filename + ".br"):
+            etags.pop(variant, None)
+            if os.path.exists(os.path.join(out_dir, variant)):
+                os.remove(os.path.join(out_dir, variant))
+
+    with open(os.path.join(out_dir, MANIFEST), "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    with open(os.path.join(out_dir, "etags.json"), "w") as f:
+        json.dump(etags, f, indent=2, sort_keys=True)
+    return rendered, skipped
+
+def main(args):
+    parser = argparse.ArgumentParser(prog="app.py export", description="Prerender every page to static HTML.")
+    parser.add_argument("out_dir", nargs="?", default="site")
+    parser.add_argument("--force", action="store_true", help="re-render pages even if their source is unchanged")
+    parser.add_argument("--live-url", help="base URL of the live app, linked from interactive pages")
+    options = parser.parse_args(args)
+    rendered, skipped = export(options.out_dir, options.force, options.live_url)
+    print(f"Rendered {len(rendered)} page(s), {len(skipped)} unchanged -> {options.out_dir}")
+    for name in rendered:
+        print(f"  {name} -> {page_file(name)}")
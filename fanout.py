@@ -0,0 +1,202 @@
+import argparse
+import asyncio
+import json
+import logging
+import random
+import sys
+import time
+from collections import OrderedDict
+
+import numpy as np
+from websockets.asyncio.client import connect
+from websockets.asyncio.server import serve
+from websockets.exceptions import ConnectionClosed
+
+from sysinfo import current_rss, raise_fd_limit
+
+# Per-connection open/close messages would drown out everything else
+logging.getLogger("websockets").setLevel(logging.WARNING)
+
+STATUSES = ["booked", "confirmed", "rescheduled", "reminded", "checked_in", "completed", "cancelled"]
+
+class Subscriber:
+    __slots__ = ("websocket", "pending", "wakeup", "in_flight")
+
+    def __init__(self, websocket):
+        self.websocket = websocket
+        # Latest undelivered update per appointment, in arrival order
+        self.pending = OrderedDict()
+        self.wakeup = asyncio.Event()
+        self.in_flight = False
+
+class Broadcaster:
+    def __init__(self, buffer_limit=256):
+        self.buffer_limit = buffer_limit
+        self.subscribers = set()
+        self.published = 0
+        self.coalesced = 0
+        self.evicted = 0
+        self.frames = 0
+
+    async def handler(self, websocket):
+        subscriber = Subscriber(websocket)
+        self.subscribers.add(subscriber)
+        # Wake the sender when the client goes away so the handler can return
+        closed = asyncio.ensure_future(websocket.wait_closed())
+        closed.add_done_callback(lambda _: subscriber.wakeup.set())
+        try:
+            while True:
+                await subscriber.wakeup.wait()
+                subscriber.wakeup.clear()
+                if closed.done():
+                    break
+                batch = list(subscriber.pending.values())
+                subscriber.pending.clear()
+                # Everything queued since the last send goes out as one frame
+                subscriber.in_flight = True
+                await websocket.send(json.dumps(batch))
+                self.frames += 1
+                # send() returns once the kernel has the frame, and socket
+                # buffers hold thousands of them. The pong comes back only after
+                # the client has read everything before it, so until then new
+                # updates wait (and coalesce, or evict) in pending.
+                await (await websocket.ping())
+                subscriber.in_flight = False
+        except ConnectionClosed:
+            pass
+        finally:
+            closed.cancel()
+            self.subscribers.discard(subscriber)
+
+    def publish(self, update):
+        self.published += 1
+        key = update["appointment_id"]
+        for subscriber in list(self.subscribers):
+            pending = subscriber.pending
+            if key in pending:
+                # A newer status supersedes one the client hasn't received yet
+                del pending[key]
+                self.coalesced += 1
+            elif len(pending) >= self.buffer_limit:
+                self.evict(subscriber)
+                continue
+            pending[key] = update
+            subscriber.wakeup.set()
+
+    def evict(self, subscriber):
+        # A client that can't keep up is dropped instead of buffering without bound
+        self.subscribers.discard(subscriber)
+        subscriber.pending.clear()
+        self.evicted += 1
+        asyncio.ensure_future(subscriber.websocket.close(1008, "slow consumer"))
+
+    def idle(self):
+        return all(not subscriber.pending and not subscriber.in_flight for subscriber in self.subscribers)
+
+class Deliveries:
+    def __init__(self):
+        self.updates = 0
+        self.latencies = []
+        self.last = None
+
+async def client(url, deliveries, delay):
+    try:
+        async with connect(url, max_queue=1) as websocket:
+            async for frame in websocket:
+                now = time.perf_counter()
+                updates = json.loads(frame)
+                deliveries.updates += len(updates)
+                deliveries.latencies.extend(now - update["sent"] for update in updates)
+                deliveries.last = now
+                if delay:
+                    await asyncio.sleep(delay)
+    except (ConnectionClosed, OSError):
+        pass
+
+async def run(clients=1_000, updates=2_000, rate=1_000, appointments=500, buffer_limit=256,
+              slow_fraction=0.0, slow_delay=0.05, connect_batch=200, seed=0):
+    # Both ends of every connection live in this process
+    if raise_fd_limit(2 * clients + 64) < 2 * clients + 64:
+        raise RuntimeError(f"open-files limit is too low for {clients:,} clients; raise ulimit -n")
+    rng = random.Random(seed)
+    broadcaster = Broadcaster(buffer_limit)
+    deliveries = Deliveries()
+    async with serve(broadcaster.handler, "127.0.0.1", 0, max_queue=1, compression=None) as server:
+        url = f"ws://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+
+        rss_before = current_rss()
+        tasks = []
+        for start in range(0, clients, connect_batch):
+            for _ in range(min(connect_batch, clients - start)):
+                delay = slow_delay if rng.random() < slow_fraction else 0
+                tasks.append(asyncio.create_task(client(url, deliveries, delay)))
+            while len(broadcaster.subscribers) < len(tasks):
+                await asyncio.sleep(0.01)
+        connection_bytes = (current_rss() - rss_before) / clients
+
+        started = time.perf_counter()
+        interval = 1 / rate if rate else 0
+        for seq in range(updates):
+            broadcaster.publish({
+                "appointment_id": rng.randrange(appointments),
+                "status": rng.choice(STATUSES),
+                "seq": seq,
+                "sent": time.perf_counter(),
+            })
+            if interval:
+                await asyncio.sleep(max(started + (seq + 1) * interval - time.perf_counter(), 0))
+            else:
+                # A burst still yields after every update, so handlers can finish
+                # their ping round-trip before their buffers fill
+                await asyncio.sleep(0)
+
+        # Let live clients drain; the clock stops at the last delivery
+        deadline = time.perf_counter() + 30
+        while not broadcaster.idle() and time.perf_counter() < deadline:
+            await asyncio.sleep(0.01)
+        elapsed = (deliveries.last or time.perf_counter()) - started
+
+        await asyncio.gather(*(subscriber.websocket.close() for subscriber in list(broadcaster.subscribers)))
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    latencies = np.asarray(deliveries.latencies) * 1000
+    return {
+        "clients": clients,
+        "published": broadcaster.published,
+        "delivered": deliveries.updates,
+        "frames": broadcaster.frames,
+        "coalesced": broadcaster.coalesced,
+        "evicted": broadcaster.evicted,
+        "elapsed": elapsed,
+        "messages_per_sec": deliveries.updates / elapsed,
+        "p50_ms": float(np.percentile(latencies, 50)) if len(latencies) else 0.0,
+        "p99_ms": float(np.percentile(latencies, 99)) if len(latencies) else 0.0,
+        "bytes_per_connection": connection_bytes,
+    }
+
+def main(args):
+    parser = argparse.ArgumentParser(prog="app.py fanout-bench", description="Benchmark WebSocket fan-out of appointment updates over localhost.")
+    parser.add_argument("--clients", type=lambda value: [int(part) for part in value.split(",")], default=[100, 1_000, 2_000])
+    parser.add_argument("--updates", type=int, default=2_000)
+    parser.add_argument("--rate", type=int, default=1_000, help="published updates/sec (0 for unthrottled)")
+    parser.add_argument("--appointments", type=int, default=500, help="distinct appointments the updates are spread over")
+    parser.add_argument("--buffer-limit", type=int, default=256, help="undelivered updates per client before eviction")
+    parser.add_argument("--slow-fraction", type=float, default=0.0)
+    parser.add_argument("--slow-delay", type=float, default=0.05, help="seconds a slow client spends per frame")
+    options = parser.parse_args(args)
+
+    evicted_healthy = []
+    print(f"{'clients':>8} {'delivered':>11} {'msgs/sec':>11} {'p50 ms':>8} {'p99 ms':>8} {'coalesced':>10} {'evicted':>8} {'KiB/conn':>9}")
+    for count in options.clients:
+        result = asyncio.run(run(
+            clients=count, updates=options.updates, rate=options.rate, appointments=options.appointments,
+            buffer_limit=options.buffer_limit, slow_fraction=options.slow_fraction, slow_delay=options.slow_delay,
+        ))
+        print(f"{count:>8} {result['delivered']:>11,} {result['messages_per_sec']:>11,.0f} {result['p50_ms']:>8.1f} "
+              f"{result['p99_ms']:>8.1f} {result['coalesced']:>10,} {result['evicted']:>8} {result['bytes_per_connection'] / 1024:>9.1f}")
+        if not options.slow_fraction and result["evicted"]:
+            evicted_healthy.append(count)
+    # With no slow clients every eviction means the broadcaster, not a client, fell behind
+    if evicted_healthy:
+        print(f"Healthy clients were evicted at {', '.join(map(str, evicted_healthy))} clients; those rows don't measure fan-out")
+        sys.exit(1)
@@ -0,0 +1,192 @@
+import argparse
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.linear_model import SGDClassifier
+
+from scoring import Writer
+from sysinfo import current_rss
+
+SENTIMENTS = ["negative", "neutral", "positive"]
+
+# Stateless, so every batch and every worker process vectorizes independently
+VECTORIZER = HashingVectorizer(n_features=2**20, ngram_range=(1, 2), alternate_sign=False, norm="l2")
+
+ID_COLUMNS = ["feedback_id"]
+
+SUBJECTS = ["the booking", "my appointment", "the reminder", "the provider", "the app", "rescheduling", "the waiting time", "the dentist", "the clinic", "checkout", "the confirmation email", "the calendar sync"]
+
+PHRASES = {
+    "positive": ["was quick and easy", "worked perfectly", "was really helpful", "saved me so much time", "was friendly and on time", "could not have been smoother", "is exactly what I needed", "was great"],
+    "neutral": ["was fine I guess", "was okay", "worked as expected", "took about ten minutes", "was on tuesday", "is what it is", "did the job", "was average"],
+    "negative": ["was a nightmare", "kept crashing", "was cancelled without notice", "took forever", "never arrived", "charged me twice", "was rude and late", "was not great", "was terrible"],
+}
+
+OPENERS = ["", "", "honestly ", "overall ", "so ", "well ", "this time "]
+
+CLOSERS = ["", "", " thanks", " will book again", " please fix this", " not sure yet", "!", " five stars", " one star"]
+
+def sample_feedback(docs, seed=0, noise=0.05):
+    rng = np.random.default_rng(seed)
+    labels = rng.choice(len(SENTIMENTS), docs, p=[0.25, 0.25, 0.5])
+    subjects = rng.integers(0, len(SUBJECTS), docs)
+    openers = rng.integers(0, len(OPENERS), docs)
+    closers = rng.integers(0, len(CLOSERS), docs)
+    phrases = rng.random(docs)
+    texts = []
+    for label, subject, opener, closer, phrase in zip(labels, subjects, openers, closers, phrases):
+        options = PHRASES[SENTIMENTS[label]]
+        texts.append(f"{OPENERS[opener]}{SUBJECTS[subject]} {options[int(phrase * len(options))]}{CLOSERS[closer]}")
+    # Some reviews say one thing and rate another
+    flipped = rng.random(docs) < noise
+    labels[flipped] = rng.integers(0, len(SENTIMENTS), flipped.sum())
+    return texts, np.array(SENTIMENTS)[labels]
+
+def sample_batches(docs, batch_size, seed=0):
+    # Generated a batch at a time, so the corpus never has to fit in memory
+    for number, start in enumerate(range(0, docs, batch_size)):
+        yield sample_feedback(min(batch_size, docs - start), seed=seed + number)
+
+def check_columns(source, required):
+    # Reads just the header, so a wrong file fails before any work starts
+    header = pd.read_csv(source, nrows=0).columns
+    if hasattr(source, "seek"):
+        source.seek(0)
+    missing = [column for column in required if column not in header]
+    if missing:
+        raise ValueError(f"missing columns: {', '.join(missing)}")
+
+def read_batches(source, batch_size):
+    check_columns(source, ["text"])
+    for chunk in pd.read_csv(source, chunksize=batch_size, dtype={"text": str, "sentiment": str}, keep_default_na=False):
+        yield chunk["text"].tolist(), chunk["sentiment"].to_numpy() if "sentiment" in chunk else None
+
+def write_sample_corpus(path, docs, batch_size=100_000, seed=0):
+    for number, (texts, labels) in enumerate(sample_batches(docs, batch_size, seed)):
+        start = number * batch_size
+        frame = pd.DataFrame({"feedback_id": np.arange(start, start + len(texts)), "text": texts, "sentiment": labels})
+        frame.to_csv(path, mode="w" if number == 0 else "a", header=number == 0, index=False)
+
+def train_stream(batches, alpha=1e-6, seed=42, progress=None):
+    # Test-then-train: each batch is scored before the model learns from it, so
+    # the running accuracy is measured on text the model hasn't seen yet
+    model = SGDClassifier(loss="log_loss", alpha=alpha, random_state=seed)
+    correct = seen = docs = 0
+    latencies = []
+    start = time.perf_counter()
+    for texts, labels in batches:
+        if labels is None:
+            raise ValueError("training needs a 'sentiment' column")
+        batch_start = time.perf_counter()
+        X = VECTORIZER.transform(texts)
+        if docs:
+            correct += int((model.predict(X) == labels).sum())
+            seen += len(labels)
+        model.partial_fit(X, labels, classes=SENTIMENTS)
+        latencies.append(time.perf_counter() - batch_start)
+        docs += len(texts)
+        if progress is not None:
+            progress(docs)
+    seconds = time.perf_counter() - start
+    return {
+        "model": model,
+        "docs": docs,
+        "seconds": seconds,
+        "docs_per_sec": docs / seconds if seconds else 0.0,
+        "accuracy": correct / seen if seen else 0.0,
+        "batch_seconds": latencies,
+    }
+
+def predict(model, texts):
+    probabilities = model.predict_proba(VECTORIZER.transform(texts))
+    best = probabilities.argmax(axis=1)
+    return model.classes_[best], probabilities[np.arange(len(best)), best]
+
+_worker_model = None
+
+def _init_worker(model):
+    global _worker_model
+    _worker_model = model
+
+def _score(texts):
+    # Vectorizing dominates, and it happens here in the worker
+    start = time.perf_counter()
+    labels, confidence = predict(_worker_model, texts)
+    return labels, confidence, time.perf_counter() - start
+
+def score_stream(source, model, out_path, batch_size=10_000, workers=0, progress=None):
+    # Like scoring.score_csv: at most one batch per worker in flight
+    check_columns(source, ["text"])
+    reader = pd.read_csv(source, chunksize=batch_size, dtype={"text": str}, keep_default_na=False)
+    writer = Writer(out_path)
+    pool = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(model,)) if workers > 0 else None
+    pending = deque()
+    stats = {"docs": 0, "batches": 0, "batch_seconds": [], "peak_rss_bytes": current_rss()}
+    start = time.perf_counter()
+
+    def flush_one():
+        ids, result = pending.popleft()
+        labels, confidence, seconds = result.result() if pool is not None else result
+        writer.write(ids.assign(sentiment=labels, confidence=confidence.astype(np.float32)))
+        stats["docs"] += len(labels)
+        stats["batches"] += 1
+        stats["batch_seconds"].append(seconds)
+        stats["peak_rss_bytes"] = max(stats["peak_rss_bytes"], current_rss())
+        if progress is not None:
+            progress(stats["docs"])
+
+    try:
+        for chunk in reader:
+            texts = chunk["text"].tolist()
+            ids = chunk[[column for column in ID_COLUMNS if column in chunk]].reset_index(drop=True)
+            if pool is not None:
+                pending.append((ids, pool.submit(_score, texts)))
+            else:
+                batch_start = time.perf_counter()
+                labels, confidence = predict(model, texts)
+                pending.append((ids, (labels, confidence, time.perf_counter() - batch_start)))
+            if len(pending) > max(workers, 1):
+                flush_one()
+        while pending:
+            flush_one()
+    finally:
+        writer.close()
+        if pool is not None:
+            pool.shutdown()
+
+    stats["seconds"] = time.perf_counter() - start
+    stats["docs_per_sec"] = stats["docs"] / stats["seconds"] if stats["seconds"] else 0.0
+    return stats
+
+def main(args):
+    parser = argparse.ArgumentParser(prog="app.py feedback", description="Train the feedback sentiment model on a CSV stream and score a corpus with it.")
+    parser.add_argument("corpus", help="CSV with a text column, and a sentiment column for training")
+    parser.add_argument("--sample", type=int, metavar="DOCS", help="first write a synthetic corpus of this many docs to CORPUS")
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    parser.add_argument("--model", help="save the trained model here (joblib), or load it if it exists")
+    parser.add_argument("--score", metavar="OUTPUT", help="score CORPUS into this .csv or .parquet file")
+    parser.add_argument("--workers", type=int, default=0, help="process pool size for scoring (0 scores in-process)")
+    options = parser.parse_args(args)
+
+    if options.sample:
+        write_sample_corpus(options.corpus, options.sample)
+    if options.model and os.path.exists(options.model):
+        model = joblib.load(options.model)
+        print(f"Loaded {options.model}")
+    else:
+        trained = train_stream(read_batches(options.corpus, options.batch_size))
+        model = trained["model"]
+        print(f"Trained on {trained['docs']:,} docs in {trained['seconds']:.1f} s ({trained['docs_per_sec']:,.0f} docs/sec), progressive accuracy {trained['accuracy']:.1%}")
+        if options.model:
+            joblib.dump(model, options.model)
+    if options.score:
+        stats = score_stream(options.corpus, model, options.score, options.batch_size, options.workers)
+        latencies = np.array(stats["batch_seconds"]) * 1000
+        print(f"Scored {stats['docs']:,} docs in {stats['seconds']:.1f} s ({stats['docs_per_sec']:,.0f} docs/sec)")
+        print(f"Per-batch latency p50 {np.percentile(latencies, 50):.0f} ms, p95 {np.percentile(latencies, 95):.0f} ms; peak RSS {stats['peak_rss_bytes'] / 2**20:.0f} MiB")
@@ -0,0 +1,203 @@
+import cProfile
+import io
+import json
+import marshal
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+QUANTILES = [0.5, 0.95, 0.99]
+
+# Recent renders kept per page for the percentiles; counts and sums cover every render
+WINDOW = 1000
+
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+class PageStats:
+    def __init__(self):
+        self.renders = 0
+        self.errors = 0
+        self.seconds_total = 0.0
+        self.elements_total = 0
+        self.seconds = deque(maxlen=WINDOW)
+        self.elements = deque(maxlen=WINDOW)
+        self.allocated = deque(maxlen=WINDOW)
+        self.peak = deque(maxlen=WINDOW)
+
+class RenderMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pages = {}
+        self._armed = None
+        self._profile = None
+        # tracemalloc slows every allocation in the process, so it is opt-in
+        self.trace_allocations = os.environ.get("SLOTIN_TRACE_ALLOCATIONS") == "1"
+
+    def set_tracing(self, enabled):
+        self.trace_allocations = enabled
+        if not enabled and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def record(self, page, seconds, elements, allocated=None, peak=None, failed=False):
+        with self._lock:
+            stats = self._pages.setdefault(page, PageStats())
+            stats.renders += 1
+            stats.errors += failed
+            stats.seconds_total += seconds
+            stats.elements_total += elements
+            stats.seconds.append(seconds)
+            stats.elements.append(elements)
+            if allocated is not None:
+                stats.allocated.append(allocated)
+                stats.peak.append(peak)
+
+    def arm_profile(self, page):
+        # The next render of this page, in whichever session runs it first, is profiled
+        with self._lock:
+            self._armed = page
+
+    def armed(self):
+        return self._armed
+
+    def take_profile(self, page):
+        with self._lock:
+            if self._armed != page:
+                return False
+            self._armed = None
+            return True
+
+    def store_profile(self, page, profiler):
+        with self._lock:
+            self._profile = {"page": page, "time": time.time(), "stats": profiler}
+
+    def last_profile(self):
+        return self._profile
+
+    def reset(self):
+        with self._lock:
+            self._pages.clear()
+
+    def summary(self):
+        with self._lock:
+            pages = {}
+            for page, stats in self._pages.items():
+                pages[page] = {
+                    "renders": stats.renders,
+                    "errors": stats.errors,
+                    "seconds_total": stats.seconds_total,
+                    "elements_total": stats.elements_total,
+                    "seconds": {str(q): percentile(stats.seconds, q) for q in QUANTILES},
+                    "elements": {str(q): percentile(stats.elements, q) for q in QUANTILES},
+                }
+                if stats.allocated:
+                    pages[page]["allocated_bytes"] = {str(q): percentile(stats.allocated, q) for q in QUANTILES}
+                    pages[page]["peak_bytes"] = {str(q): percentile(stats.peak, q) for q in QUANTILES}
+            return pages
+
+    def to_json(self):
+        return json.dumps({"window": WINDOW, "pages": self.summary()}, indent=2, sort_keys=True)
+
+    def to_prometheus(self):
+        pages = self.summary()
+        lines = []
+
+        def summary_metric(name, help_text, key, sum_key=None):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} summary")
+            for page, stats in pages.items():
+                if key not in stats:
+                    continue
+                label = page.replace("\\", "\\\\").replace('"', '\\"')
+                for q, value in stats[key].items():
+                    lines.append(f'{name}{{page="{label}",quantile="{q}"}} {value}')
+                if sum_key:
+                    lines.append(f'{name}_sum{{page="{label}"}} {stats[sum_key]}')
+                    lines.append(f'{name}_count{{page="{label}"}} {stats["renders"]}')
+
+        summary_metric("slotin_page_render_seconds", "Wall time of one page render.", "seconds", sum_key="seconds_total")
+        summary_metric("slotin_page_render_elements", "Elements emitted by one page render.", "elements", sum_key="elements_total")
+        summary_metric("slotin_page_render_allocated_bytes", "Net traced allocations left behind by one page render.", "allocated_bytes")
+        summary_metric("slotin_page_render_peak_bytes", "Peak traced allocations during one page render.", "peak_bytes")
+        lines.append("# HELP slotin_page_render_errors_total Page renders that raised.")
+        lines.append("# TYPE slotin_page_render_errors_total counter")
+        for page, stats in pages.items():
+            label = page.replace("\\", "\\\\").replace('"', '\\"')
+            lines.append(f'slotin_page_render_errors_total{{page="{label}"}} {stats["errors"]}')
+        return "\n".join(lines) + "\n"
+
+METRICS = RenderMetrics()
+
+@contextmanager
+def counting_elements():
+    # Count the delta messages this session sends while the page runs. There is
+    # no public hook for this, so it wraps the private ScriptRunContext._enqueue
+    # (written against Streamlit 1.65); if that goes away it counts nothing.
+    ctx = get_script_run_ctx()
+    counter = [0]
+    if ctx is None or not callable(getattr(ctx, "_enqueue", None)):
+        yield counter
+        return
+    enqueue = ctx._enqueue
+
+    def counted(msg):
+        if msg.HasField("delta"):
+            counter[0] += 1
+        enqueue(msg)
+
+    ctx._enqueue = counted
+    try:
+        yield counter
+    finally:
+        ctx._enqueue = enqueue
+
+def instrumented(page, render):
+    profiler = cProfile.Profile() if METRICS.take_profile(page) else None
+    tracing = METRICS.trace_allocations
+    if tracing and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    failed = False
+    with counting_elements() as elements:
+        if tracing:
+            # Other sessions allocate concurrently, so these are approximate under load
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            if profiler is not None:
+                profiler.runcall(render)
+            else:
+                render()
+        except Exception:
+            # st.rerun() and st.stop() are BaseExceptions and don't count as failures
+            failed = True
+            raise
+        finally:
+            seconds = time.perf_counter() - start
+            allocated = peak = None
+            if tracing and tracemalloc.is_tracing():
+                current, peak = tracemalloc.get_traced_memory()
+                allocated = current - before
+                peak -= before
+            METRICS.record(page, seconds, elements[0], allocated, peak, failed)
+            if profiler is not None:
+                METRICS.store_profile(page, profiler)
+
+def profile_bytes(profiler):
+    # The format pstats.dump_stats writes; open with snakeviz, tuna or flameprof
+    return marshal.dumps(pstats.Stats(profiler).stats)
+
+def profile_text(profiler, limit=25):
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(limit)
+    return out.getvalue()
@@ -0,0 +1,215 @@
+import argparse
+import asyncio
+import heapq
+import itertools
+import random
+import time
+from collections import deque
+
+import numpy as np
+
+class Message:
+    __slots__ = ("id", "payload", "enqueued_at", "attempts")
+
+    def __init__(self, id, payload):
+        self.id = id
+        self.payload = payload
+        self.enqueued_at = time.perf_counter()
+        self.attempts = 0
+
+class MemoryQueue:
+    # The operations the workers rely on, mirroring a Redis list/stream queue:
+    # blocking put with backpressure, batched get_batch, batched ack, delayed
+    # redelivery through retry, and depth/in_flight for monitoring. A queue
+    # backed by Redis only needs these same methods.
+    def __init__(self, maxsize=1000):
+        self.maxsize = maxsize
+        self._items = deque()
+        self._in_flight = {}
+        self._delayed = []
+        self._sequence = itertools.count()
+        self._changed = asyncio.Condition()
+
+    async def put(self, message):
+        async with self._changed:
+            # Producers wait while the queue is full; this is the backpressure
+            await self._changed.wait_for(lambda: len(self._items) < self.maxsize)
+            self._items.append(message)
+            self._changed.notify_all()
+
+    def _release_delayed(self):
+        now = time.perf_counter()
+        while self._delayed and self._delayed[0][0] <= now:
+            # Retries skip the size check so workers never block on a full queue
+            self._items.append(heapq.heappop(self._delayed)[2])
+
+    async def get_batch(self, size, timeout):
+        deadline = time.perf_counter() + timeout
+        async with self._changed:
+            while True:
+                self._release_delayed()
+                if self._items:
+                    break
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    return []
+                if self._delayed:
+                    remaining = min(remaining, self._delayed[0][0] - time.perf_counter())
+                try:
+                    await asyncio.wait_for(self._changed.wait(), max(remaining, 0.001))
+                except asyncio.TimeoutError:
+                    pass
+            batch = [self._items.popleft() for _ in range(min(size, len(self._items)))]
+            for message in batch:
+                self._in_flight[message.id] = message
+            self._changed.notify_all()
+            return batch
+
+    async def ack(self, messages):
+        for message in messages:
+            self._in_flight.pop(message.id, None)
+
+    async def retry(self, message, delay):
+        self._in_flight.pop(message.id, None)
+        heapq.heappush(self._delayed, (time.perf_counter() + delay, next(self._sequence), message))
+        async with self._changed:
+            self._changed.notify_all()
+
+    def depth(self):
+        return len(self._items) + len(self._delayed)
+
+    def in_flight(self):
+        return len(self._in_flight)
+
+class RetryPolicy:
+    def __init__(self, max_attempts=3, base_delay=0.05, multiplier=2.0, max_delay=1.0, jitter=0.1):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.multiplier = multiplier
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    def delay(self, attempt, rng=random):
+        delay = min(self.base_delay * self.multiplier ** (attempt - 1), self.max_delay)
+        return delay * (1 + rng.uniform(-self.jitter, self.jitter))
+
+class Stats:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.produced = 0
+        self.completed = 0
+        self.retried = 0
+        self.dead_lettered = 0
+        self.producer_blocked = 0.0
+        self.latencies = []
+
+    def percentiles(self):
+        if not self.latencies:
+            return {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+        values = np.percentile(self.latencies, [50, 95, 99]) * 1000
+        return dict(zip(("p50", "p95", "p99"), values.tolist()))
+
+async def producer(queue, stats, messages, rate):
+    interval = 1 / rate if rate else 0
+    next_send = time.perf_counter()
+    for id in range(messages):
+        if interval:
+            next_send += interval
+            await asyncio.sleep(max(next_send - time.perf_counter(), 0))
+        before = time.perf_counter()
+        await queue.put(Message(id, {"appointment_id": id, "action": "confirm"}))
+        stats.producer_blocked += time.perf_counter() - before
+        stats.produced += 1
+
+async def worker(queue, stats, batch_size, per_batch_ms, per_message_ms, failure_rate, retry, rng, done):
+    while not done.is_set():
+        batch = await queue.get_batch(batch_size, timeout=0.05)
+        if not batch:
+            continue
+        # One round trip per batch (e.g. a bulk DB write) plus per-message work
+        await asyncio.sleep((per_batch_ms + per_message_ms * len(batch)) / 1000)
+        succeeded = []
+        for message in batch:
+            message.attempts += 1
+            if rng.random() >= failure_rate:
+                succeeded.append(message)
+            elif message.attempts < retry.max_attempts:
+                stats.retried += 1
+                await queue.retry(message, retry.delay(message.attempts, rng))
+            else:
+                stats.dead_lettered += 1
+                await queue.ack([message])
+        await queue.ack(succeeded)
+        now = time.perf_counter()
+        stats.latencies.extend(now - message.enqueued_at for message in succeeded)
+        stats.completed += len(succeeded)
+
+def snapshot(queue, stats, previous_completed, interval):
+    return {
+        "elapsed": time.perf_counter() - stats.started,
+        "produced": stats.produced,
+        "completed": stats.completed,
+        "retried": stats.retried,
+        "dead_lettered": stats.dead_lettered,
+        "depth": queue.depth(),
+        "in_flight": queue.in_flight(),
+        "throughput": (stats.completed - previous_completed) / interval,
+        "producer_blocked": stats.producer_blocked,
+        **stats.percentiles(),
+    }
+
+async def run(messages=5_000, rate=2_000, workers=8, batch_size=10, queue_size=1_000,
+              per_batch_ms=5.0, per_message_ms=0.5, failure_rate=0.01, retry=None,
+              on_tick=None, tick=0.25, seed=0):
+    retry = retry or RetryPolicy()
+    rng = random.Random(seed)
+    queue = MemoryQueue(queue_size)
+    stats = Stats()
+    done = asyncio.Event()
+    tasks = [
+        asyncio.create_task(worker(queue, stats, batch_size, per_batch_ms, per_message_ms, failure_rate, retry, rng, done))
+        for _ in range(workers)
+    ]
+    produce = asyncio.create_task(producer(queue, stats, messages, rate))
+
+    completed = 0
+    while not (produce.done() and stats.completed + stats.dead_lettered >= messages):
+        await asyncio.sleep(tick)
+        if on_tick is not None:
+            on_tick(snapshot(queue, stats, completed, tick))
+        completed = stats.completed
+    done.set()
+    await asyncio.gather(produce, *tasks)
+
+    result = snapshot(queue, stats, 0, time.perf_counter() - stats.started)
+    result["throughput"] = stats.completed / result["elapsed"]
+    return result
+
+def simulate(**options):
+    return asyncio.run(run(**options))
+
+def parse_list(value):
+    return [int(part) for part in value.split(",")]
+
+def main(args):
+    parser = argparse.ArgumentParser(prog="app.py queue-sim", description="Sweep worker count and batch size for the booking queue.")
+    parser.add_argument("--messages", type=int, default=5_000)
+    parser.add_argument("--rate", type=int, default=2_000, help="producer messages/sec (0 for unthrottled)")
+    parser.add_argument("--workers", type=parse_list, default=[4, 8, 16])
+    parser.add_argument("--batch-size", type=parse_list, default=[1, 10, 50])
+    parser.add_argument("--queue-size", type=int, default=1_000)
+    parser.add_argument("--per-batch-ms", type=float, default=5.0)
+    parser.add_argument("--per-message-ms", type=float, default=0.5)
+    parser.add_argument("--failure-rate", type=float, default=0.01)
+    options = parser.parse_args(args)
+
+    print(f"{'workers':>8} {'batch':>6} {'msgs/sec':>10} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'blocked s':>10} {'dead':>6}")
+    for workers in options.workers:
+        for batch_size in options.batch_size:
+            result = simulate(
+                messages=options.messages, rate=options.rate, workers=workers, batch_size=batch_size,
+                queue_size=options.queue_size, per_batch_ms=options.per_batch_ms,
+                per_message_ms=options.per_message_ms, failure_rate=options.failure_rate,
+            )
+            print(f"{workers:>8} {batch_size:>6} {result['throughput']:>10,.0f} {result['p50']:>8.1f} {result['p95']:>8.1f} "
+                  f"{result['p99']:>8.1f} {result['producer_blocked']:>10.2f} {result['dead_lettered']:>6}")
@@ -0,0 +1,108 @@
+import re
+import threading
+import textwrap
+from contextlib import contextmanager
+
+import streamlit as st
+from views import load_docs
+
+# Streamlit calls that produce static content and are captured as elements
+ELEMENTS = ["title", "header", "subheader", "write", "markdown", "code", "caption", "text", "image", "divider"]
+
+# Widgets return their default value while recording
+WIDGETS = {"button": False, "checkbox": False, "toggle": False}
+
+CONTAINERS = ["container", "expander"]
+
+_local = threading.local()
+_lock = threading.Lock()
+_originals = {}
+_active = 0
+
+class Container:
+    # Collapsed sections render their body only when open; recordings want everything
+    open = True
+
+    def __init__(self, recording):
+        self._recording = recording
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        if name not in ELEMENTS and name not in WIDGETS and name not in CONTAINERS:
+            raise AttributeError(name)
+        return lambda *args, **kwargs: self._recording.record(name, args, kwargs)
+
+class Recording:
+    def __init__(self):
+        self.elements = []
+
+    def record(self, name, args, kwargs):
+        if name in WIDGETS:
+            return WIDGETS[name]
+        if name in CONTAINERS:
+            # An expander's label is the heading of what it holds
+            if name == "expander" and args:
+                self.elements.append({"type": "subheader", "body": str(args[0])})
+            return Container(self)
+        element = {"type": name}
+        if args:
+            body = args[0]
+            element["body"] = body if isinstance(body, bytes) else textwrap.dedent(str(body)).strip()
+        for key in ("language", "caption"):
+            if kwargs.get(key) is not None:
+                element[key] = kwargs[key]
+        self.elements.append(element)
+        return None
+
+def _dispatcher(name, original):
+    # Installed on the streamlit module itself; only the recording thread is
+    # redirected, every other session keeps calling the real function.
+    def call(*args, **kwargs):
+        recording = getattr(_local, "recording", None)
+        if recording is None:
+            return original(*args, **kwargs)
+        return recording.record(name, args, kwargs)
+    return call
+
+def _install():
+    global _active
+    with _lock:
+        if _active == 0:
+            for name in ELEMENTS + list(WIDGETS) + CONTAINERS:
+                _originals[name] = getattr(st, name)
+                setattr(st, name, _dispatcher(name, _originals[name]))
+        _active += 1
+
+def _uninstall():
+    global _active
+    with _lock:
+        _active -= 1
+        if _active == 0:
+            for name, original in _originals.items():
+                setattr(st, name, original)
+            _originals.clear()
+
+@contextmanager
+def recording():
+    rec = Recording()
+    _install()
+    _local.recording = rec
+    try:
+        yield rec
+    finally:
+        _local.recording = None
+        _uninstall()
+
+def slugify(text):
+    # Matches the anchors Streamlit gives headers, e.g. "🗺 Roadmap" -> "roadmap"
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+def record_page(name):
+    with recording() as rec:
+        load_docs(name)()
+    return rec.elements
@@ -0,0 +1,299 @@
+import bisect
+import gc
+import math
+import pickle
+import time
+from array import array
+from contextlib import contextmanager
+from itertools import repeat
+
+import numpy as np
+
+# Level 0 has one slot per tick; each higher level has 64 slots that each
+# span a whole turn of the level below, so five levels cover 2**32 ticks.
+LEVEL0_BITS = 8
+LEVEL_BITS = 6
+LEVELS = 4
+LEVEL0_SIZE = 1 << LEVEL0_BITS
+LEVEL_SIZE = 1 << LEVEL_BITS
+MAX_DELTA = 1 << (LEVEL0_BITS + LEVEL_BITS * LEVELS)
+
+# Slot 0 holds reminders that are already due; the wheel levels follow it
+OVERDUE = 0
+SLOTS = 1 + LEVEL0_SIZE + LEVELS * LEVEL_SIZE
+
+# Wheel level of each slot; the overdue slot belongs to no level
+LEVEL_OF = [None] + [0] * LEVEL0_SIZE + [1 + i // LEVEL_SIZE for i in range(LEVELS * LEVEL_SIZE)]
+
+SNAPSHOT_VERSION = 1
+
+@contextmanager
+def paused_gc():
+    # Millions of new objects would otherwise trigger repeated full collections
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+class TimingWheel:
+    # Hierarchical timing wheel: schedule, cancel and reschedule are O(1)
+    # dict operations, and advancing fires every due reminder in one batch.
+    def __init__(self, resolution=60.0, now=0.0):
+        self.resolution = resolution
+        self.tick = int(now // resolution)
+        self._slots = [{} for _ in range(SLOTS)]
+        self._slot_of = {}
+        self._payloads = {}
+        # Pending reminders per level, so advance() can jump over empty levels
+        self._counts = [0] * (LEVELS + 1)
+
+    def __len__(self):
+        return len(self._slot_of)
+
+    def __contains__(self, id):
+        return id in self._slot_of
+
+    def _slot(self, due):
+        # Rounded up so a reminder never fires before it is due
+        due_tick = math.ceil(due / self.resolution)
+        delta = due_tick - self.tick
+        if delta <= 0:
+            return OVERDUE
+        if delta < LEVEL0_SIZE:
+            return 1 + (due_tick & (LEVEL0_SIZE - 1))
+        if delta >= MAX_DELTA:
+            # Parked in the farthest slot; it is re-placed when that slot cascades
+            due_tick = self.tick + MAX_DELTA - 1
+            delta = MAX_DELTA - 1
+        level = 1
+        while delta >= 1 << (LEVEL0_BITS + LEVEL_BITS * level):
+            level += 1
+        shift = LEVEL0_BITS + LEVEL_BITS * (level - 1)
+        return 1 + LEVEL0_SIZE + (level - 1) * LEVEL_SIZE + ((due_tick >> shift) & (LEVEL_SIZE - 1))
+
+    def _put(self, id, due):
+        slot = self._slot(due)
+        self._slots[slot][id] = due
+        self._slot_of[id] = slot
+        level = LEVEL_OF[slot]
+        if level is not None:
+            self._counts[level] += 1
+
+    def _remove(self, id, slot):
+        del self._slots[slot][id]
+        level = LEVEL_OF[slot]
+        if level is not None:
+            self._counts[level] -= 1
+
+    def schedule(self, id, due, payload=None):
+        # Scheduling an id that is already pending reschedules it
+        slot = self._slot_of.get(id)
+        if slot is not None:
+            self._remove(id, slot)
+        self._put(id, due)
+        if payload is not None:
+            self._payloads[id] = payload
+        elif id in self._payloads:
+            del self._payloads[id]
+
+    reschedule = schedule
+
+    def cancel(self, id):
+        slot = self._slot_of.pop(id, None)
+        if slot is None:
+            return False
+        self._remove(id, slot)
+        self._payloads.pop(id, None)
+        return True
+
+    def due(self, id):
+        slot = self._slot_of.get(id)
+        return None if slot is None else self._slots[slot][id]
+
+    def _cascade(self, level, index):
+        slot = 1 + LEVEL0_SIZE + (level - 1) * LEVEL_SIZE + index
+        entries = self._slots[slot]
+        if not entries:
+            return
+        self._slots[slot] = {}
+        self._counts[level] -= len(entries)
+        for id, due in entries.items():
+            self._put(id, due)
+
+    def _take(self, slot, fired):
+        entries = self._slots[slot]
+        if not entries:
+            return
+        self._slots[slot] = {}
+        if LEVEL_OF[slot] is not None:
+            self._counts[LEVEL_OF[slot]] -= len(entries)
+        slot_of = self._slot_of
+        payloads = self._payloads
+        for id, due in entries.items():
+            del slot_of[id]
+            fired.append((id, due, payloads.pop(id, None) if payloads else None))
+
+    def advance(self, now):
+        # Returns (id, due, payload) for every reminder due by the last tick
+        # boundary at or before `now`; reminders fire at most one tick late
+        fired = []
+        target = int(now // self.resolution)
+        if not self._slot_of:
+            self.tick = max(self.tick, target)
+            return fired
+        while self.tick < target:
+            lowest = next(level for level, count in enumerate(self._counts + [1]) if count)
+            if lowest > LEVELS:
+                # Only overdue reminders are left
+                self.tick = target
+                break
+            if lowest > 0:
+                # Nothing can fire before the next slot of the lowest non-empty
+                # level cascades, so jump to just before that boundary
+                span = 1 << (LEVEL0_BITS + LEVEL_BITS * (lowest - 1))
+                self.tick = min(target, self.tick | (span - 1))
+                if self.tick == target:
+                    break
+            self.tick += 1
+            index = self.tick & (LEVEL0_SIZE - 1)
+            if index == 0:
+                for level in range(1, LEVELS + 1):
+                    shift = LEVEL0_BITS + LEVEL_BITS * (level - 1)
+                    level_index = (self.tick >> shift) & (LEVEL_SIZE - 1)
+                    self._cascade(level, level_index)
+                    if level_index != 0:
+                        break
+            self._take(1 + index, fired)
+        self._take(OVERDUE, fired)
+        return fired
+
+    def snapshot(self, path):
+        # Slot contents are written as-is, so restoring is a handful of C-level
+        # dict builds rather than one schedule() call per reminder.
+        with paused_gc():
+            slots = [(list(entries), array("d", entries.values())) for entries in self._slots]
+            state = (SNAPSHOT_VERSION, self.resolution, self.tick, slots, self._payloads)
+            with open(path, "wb") as f:
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def restore(cls, path):
+        with paused_gc():
+            with open(path, "rb") as f:
+                version, resolution, tick, slots, payloads = pickle.load(f)
+            if version != SNAPSHOT_VERSION:
+                raise ValueError(f"unsupported reminder snapshot version {version}")
+            wheel = cls(resolution)
+            wheel.tick = tick
+            wheel._payloads = payloads
+            for slot, (ids, dues) in enumerate(slots):
+                wheel._slots[slot] = dict(zip(ids, dues))
+                wheel._slot_of.update(zip(ids, repeat(slot)))
+                if LEVEL_OF[slot] is not None:
+                    wheel._counts[LEVEL_OF[slot]] += len(ids)
+        return wheel
+
+class SortedListScheduler:
+    # Naive baseline: one list kept sorted by due time
+    def __init__(self):
+        self._items = []
+        self._due = {}
+
+    def __len__(self):
+        return len(self._due)
+
+    def schedule(self, id, due, payload=None):
+        if id in self._due:
+            self.cancel(id)
+        bisect.insort(self._items, (due, id))
+        self._due[id] = due
+
+    def cancel(self, id):
+        due = self._due.pop(id, None)
+        if due is None:
+            return False
+        del self._items[bisect.bisect_left(self._items, (due, id))]
+        return True
+
+    def advance(self, now):
+        end = bisect.bisect_right(self._items, (now, float("inf")))
+        fired = self._items[:end]
+        del self._items[:end]
+        for _, id in fired:
+            del self._due[id]
+        return [(id, due, None) for due, id in fired]
+
+    def load(self, ids, dues):
+        self._items = sorted(zip(dues, ids))
+        self._due = dict(zip(ids, dues))
+
+# Reminders sent before every appointment, in seconds
+REMINDER_OFFSETS = [24 * 3600, 3600]
+
+def reminder_ids(appointment):
+    return [appointment * len(REMINDER_OFFSETS) + k for k in range(len(REMINDER_OFFSETS))]
+
+def simulate_day(existing=100_000, bookings=20_000, cancel_rate=0.05, modify_rate=0.05, horizon_days=14, seed=0):
+    # Replays a day minute by minute: new bookings schedule their reminders,
+    # cancellations remove them, modifications reschedule them, and the wheel
+    # fires whatever is due each minute.
+    day = 24 * 3600
+    rng = np.random.default_rng(seed)
+    wheel = TimingWheel(resolution=60.0)
+    stats = {"scheduled": 0, "cancelled": 0, "rescheduled": 0, "fired": 0}
+
+    def book(appointment, start, now):
+        # Reminders whose time has already passed are skipped
+        for id, offset in zip(reminder_ids(appointment), REMINDER_OFFSETS):
+            if start - offset > now:
+                wheel.schedule(id, start - offset, payload=appointment)
+                stats["scheduled"] += 1
+
+    starts = {}
+    for appointment, start in enumerate(rng.uniform(0, horizon_days * day, existing).tolist()):
+        starts[appointment] = start
+        book(appointment, start, 0)
+
+    # Events during the day: (minute, kind, appointment)
+    minutes = np.sort(rng.integers(0, 24 * 60, bookings))
+    new_starts = (minutes * 60 + rng.uniform(3600, horizon_days * day, bookings)).tolist()
+    events = [[] for _ in range(24 * 60)]
+    for i, minute in enumerate(minutes.tolist()):
+        events[minute].append(("book", existing + i, new_starts[i]))
+    for kind, share in (("cancel", cancel_rate), ("modify", modify_rate)):
+        count = int((existing + bookings) * share)
+        for minute, appointment in zip(rng.integers(0, 24 * 60, count).tolist(), rng.integers(0, existing, count).tolist()):
+            events[minute].append((kind, appointment, None))
+
+    fired_per_hour = [0] * 24
+    batch_sizes = []
+    started = time.perf_counter()
+    for minute in range(24 * 60):
+        now = minute * 60
+        for kind, appointment, start in events[minute]:
+            if kind == "book":
+                starts[appointment] = start
+                book(appointment, start, now)
+            elif appointment in starts:
+                if kind == "cancel":
+                    del starts[appointment]
+                    stats["cancelled"] += sum(wheel.cancel(id) for id in reminder_ids(appointment))
+                else:
+                    starts[appointment] = max(starts[appointment] + rng.uniform(-day, day), now + 3600)
+                    for id, offset in zip(reminder_ids(appointment), REMINDER_OFFSETS):
+                        if id in wheel:
+                            wheel.reschedule(id, starts[appointment] - offset, payload=appointment)
+                            stats["rescheduled"] += 1
+        fired = wheel.advance(now + 60)
+        fired_per_hour[minute // 60] += len(fired)
+        batch_sizes.append(len(fired))
+        stats["fired"] += len(fired)
+
+    stats["seconds"] = time.perf_counter() - started
+    stats["pending"] = len(wheel)
+    stats["fired_per_hour"] = fired_per_hour
+    stats["largest_batch"] = max(batch_sizes)
+    return wheel, stats
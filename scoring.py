@@ -0,0 +1,157 @@
+import argparse
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+import classifier
+from sysinfo import current_rss
+
+# Columns carried through to the output next to each prediction, when present
+ID_COLUMNS = ["appointment_id"]
+
+# Where the docs pages write scored files; only the CLI takes a free-form path
+SCORES_DIR = os.environ.get("SLOTIN_SCORES_DIR", "data/scores")
+
+_worker_model = None
+
+def _init_worker(model):
+    global _worker_model
+    _worker_model = model
+
+def _predict(X):
+    # The worker's RSS right after predicting, so peaks are per run rather
+    # than whatever child this process ever reaped
+    predictions = _worker_model.predict(X)
+    return predictions, current_rss()
+
+def output_path(name):
+    # A plain .csv/.parquet file name inside SCORES_DIR, never a path
+    if not name or name.startswith(".") or os.sep in name or (os.altsep and os.altsep in name):
+        raise ValueError(f"{name!r} is not a plain file name")
+    if not name.endswith((".csv", ".parquet")):
+        raise ValueError(f"{name!r} must end in .csv or .parquet")
+    os.makedirs(SCORES_DIR, exist_ok=True)
+    return os.path.join(SCORES_DIR, name)
+
+class Writer:
+    def __init__(self, path):
+        self.path = path
+        self.parquet = path.endswith(".parquet")
+        self._writer = None
+
+    def write(self, frame):
+        if self.parquet:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if self._writer is None:
+                self._writer = pq.ParquetWriter(self.path, table.schema)
+            self._writer.write_table(table)
+        else:
+            frame.to_csv(self.path, mode="w" if self._writer is None else "a", header=self._writer is None, index=False)
+            self._writer = True
+
+    def close(self):
+        if self.parquet and self._writer is not None:
+            self._writer.close()
+
+def score_csv(source, trained, out_path, chunksize=100_000, workers=0, progress=None):
+    # `source` is a path or a binary file object (e.g. a Streamlit upload).
+    # Only one chunk per worker, plus one being written, is held in memory.
+    handle = open(source, "rb") if isinstance(source, str) else source
+    handle.seek(0, os.SEEK_END)
+    total_bytes = handle.tell() or 1
+    handle.seek(0)
+
+    features = trained["features"]
+    header = pd.read_csv(handle, nrows=0).columns
+    handle.seek(0)
+    missing = [feature for feature in features if feature not in header]
+    if missing:
+        if isinstance(source, str):
+            handle.close()
+        raise ValueError(f"missing columns: {', '.join(missing)}")
+    passthrough = [column for column in ID_COLUMNS if column in header]
+    reader = pd.read_csv(
+        handle,
+        usecols=passthrough + features,
+        dtype={feature: np.float32 for feature in features},
+        chunksize=chunksize,
+    )
+
+    writer = Writer(out_path)
+    pool = None
+    if workers > 0:
+        pool = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(trained["model"],))
+    pending = deque()
+    stats = {"rows": 0, "chunks": 0, "peak_rss_bytes": current_rss()}
+    start = time.perf_counter()
+
+    def flush_one():
+        chunk_start, ids, predictions = pending.popleft()
+        if pool is not None:
+            predictions, worker_rss = predictions.result()
+            stats["worker_peak_rss_bytes"] = max(stats.get("worker_peak_rss_bytes", 0), worker_rss)
+        frame = ids.assign(row=np.arange(chunk_start, chunk_start + len(predictions)), prediction=predictions)
+        writer.write(frame[["row"] + passthrough + ["prediction"]])
+        stats["rows"] += len(predictions)
+        stats["chunks"] += 1
+        stats["peak_rss_bytes"] = max(stats["peak_rss_bytes"], current_rss())
+        if progress is not None:
+            progress(min(handle.tell() / total_bytes, 1.0), stats["rows"])
+
+    try:
+        row = 0
+        for chunk in reader:
+            X = chunk[features].to_numpy()
+            ids = chunk[passthrough].reset_index(drop=True)
+            predictions = pool.submit(_predict, X) if pool is not None else trained["model"].predict(X)
+            pending.append((row, ids, predictions))
+            row += len(chunk)
+            # Bound the number of chunks in flight so memory stays flat
+            if len(pending) > max(workers, 1):
+                flush_one()
+        while pending:
+            flush_one()
+    finally:
+        writer.close()
+        if pool is not None:
+            pool.shutdown()
+        if isinstance(source, str):
+            handle.close()
+
+    stats["seconds"] = time.perf_counter() - start
+    stats["rows_per_sec"] = stats["rows"] / stats["seconds"] if stats["seconds"] else 0.0
+    return stats
+
+def write_sample_csv(path, rows, features=8, chunksize=500_000, seed=0):
+    rng = np.random.default_rng(seed)
+    columns = classifier.feature_names(features)
+    for start in range(0, rows, chunksize):
+        size = min(chunksize, rows - start)
+        frame = pd.DataFrame(rng.standard_normal((size, features), dtype=np.float32), columns=columns)
+        frame.insert(0, "appointment_id", np.arange(start, start + size))
+        frame.to_csv(path, mode="w" if start == 0 else "a", header=start == 0, index=False, float_format="%.5f")
+
+def main(args):
+    parser = argparse.ArgumentParser(prog="app.py score", description="Stream a CSV through the appointment classifier.")
+    parser.add_argument("source")
+    parser.add_argument("output", help="a .csv or .parquet path")
+    parser.add_argument("--chunksize", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, default=0, help="process pool size (0 scores in-process)")
+    parser.add_argument("--features", type=int, default=8)
+    parser.add_argument("--sample", type=int, metavar="ROWS", help="first write a synthetic CSV of this many rows to SOURCE")
+    options = parser.parse_args(args)
+
+    if options.sample:
+        write_sample_csv(options.source, options.sample, options.features)
+    trained = classifier.train(features=options.features)
+    stats = score_csv(options.source, trained, options.output, options.chunksize, options.workers)
+    print(f"Scored {stats['rows']:,} rows in {stats['chunks']} chunks, {stats['seconds']:.2f} s ({stats['rows_per_sec']:,.0f} rows/sec)")
+    print(f"Peak RSS: {stats['peak_rss_bytes'] / 2**20:.1f} MiB")
+    if "worker_peak_rss_bytes" in stats:
+        print(f"Peak worker RSS: {stats['worker_peak_rss_bytes'] / 2**20:.1f} MiB")
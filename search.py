@@ -0,0 +1,112 @@
+import bisect
+import math
+import re
+from collections import Counter, defaultdict
+
+import numpy as np
+
+from recorder import record_page, slugify
+from views import PAGES, LIVE_PAGES
+
+TOKEN = re.compile(r"[a-z0-9]+")
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# Query terms match every indexed term they prefix, up to this many expansions
+MAX_EXPANSIONS = 50
+PREFIX_WEIGHT = 0.8
+
+HEADINGS = ("title", "header", "subheader")
+
+def tokenize(text):
+    return TOKEN.findall(text.lower())
+
+def page_sections(name):
+    # One document per subheader, so results can link to the section itself
+    sections = []
+    heading, anchor, parts = None, None, []
+    for element in record_page(name):
+        body = element.get("body")
+        if not isinstance(body, str):
+            continue
+        if element["type"] in ("header", "subheader"):
+            if parts:
+                sections.append((heading, anchor, "\n".join(parts)))
+            heading, anchor, parts = body, slugify(body), [body]
+        else:
+            parts.append(body)
+    if parts:
+        sections.append((heading, anchor, "\n".join(parts)))
+    return sections
+
+def corpus():
+    docs = []
+    for name in PAGES:
+        if name in LIVE_PAGES:
+            continue
+        for heading, anchor, text in page_sections(name):
+            docs.append({"page": name, "section": heading, "anchor": anchor, "text": text})
+    return docs
+
+class SearchIndex:
+    def __init__(self, docs):
+        self.docs = docs
+        counts = []
+        lengths = []
+        for doc in docs:
+            tokens = tokenize(doc["text"])
+            lengths.append(len(tokens))
+            counts.append(Counter(tokens))
+        avgdl = sum(lengths) / len(lengths) if lengths else 0
+
+        postings = defaultdict(list)
+        for doc_id, terms in enumerate(counts):
+            for term, tf in terms.items():
+                postings[term].append((doc_id, tf))
+
+        # BM25 term weights are computed once here, so a query only sums them
+        n = len(docs)
+        lengths = np.asarray(lengths, dtype=np.float32)
+        self.postings = {}
+        for term, entries in postings.items():
+            idf = math.log(1 + (n - len(entries) + 0.5) / (len(entries) + 0.5))
+            doc_ids = np.array([doc_id for doc_id, _ in entries], dtype=np.int32)
+            tfs = np.array([tf for _, tf in entries], dtype=np.float32)
+            norms = 1 - B + B * lengths[doc_ids] / avgdl
+            self.postings[term] = (doc_ids, idf * tfs * (K1 + 1) / (tfs + K1 * norms))
+        self.terms = sorted(self.postings)
+
+    def expand(self, token):
+        start = bisect.bisect_left(self.terms, token)
+        expansions = []
+        for term in self.terms[start:start + MAX_EXPANSIONS]:
+            if not term.startswith(token):
+                break
+            expansions.append((term, 1.0 if term == token else PREFIX_WEIGHT))
+        return expansions
+
+    def search(self, query, limit=10):
+        scores = np.zeros(len(self.docs), dtype=np.float32)
+        for token in set(tokenize(query)):
+            for term, boost in self.expand(token):
+                doc_ids, weights = self.postings[term]
+                # Doc ids are unique within a posting list, so fancy-index add is safe
+                scores[doc_ids] += boost * weights
+        matched = np.flatnonzero(scores)
+        if len(matched) > limit:
+            matched = matched[np.argpartition(scores[matched], -limit)[-limit:]]
+        best = matched[np.argsort(-scores[matched], kind="stable")]
+        return [dict(self.docs[doc_id], score=float(scores[doc_id])) for doc_id in best]
+
+def build_index():
+    return SearchIndex(corpus())
+
+def link(result):
+    url = "?page=" + result["page"].replace(" ", "+")
+    if result["anchor"]:
+        # The fragment scrolls to the heading; section= lets a collapsed page
+        # show that section open, since expanders have no anchor of their own
+        url += "&section=" + result["anchor"] + "#" + result["anchor"]
+    return url
@@ -0,0 +1,39 @@
+import re
+import subprocess
+import sys
+
+from views import PAGES
+
+# Modules that used to be imported eagerly by app.py, reported for comparison.
+OPTIONAL_COMPONENTS = ["streamlit_option_menu", "streamlit_lottie"]
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+def import_time(module, after=None):
+    # Each module is imported in a fresh interpreter so the numbers reflect a
+    # cold start rather than whatever is already in sys.modules. Modules in
+    # `after` are imported first and excluded from the measurement.
+    code = "".join(f"import {name}; " for name in after or []) + f"import {module}"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        return None
+    for line in reversed(result.stderr.splitlines()):
+        match = IMPORTTIME_LINE.match(line)
+        if match and match.group(4) == module:
+            return int(match.group(2)) / 1000
+    return None
+
+def report(args=()):
+    print(f"{'module':<40} {'import (ms)':>14}")
+    rows = [("streamlit", None)]
+    # Everything else is measured on top of streamlit, which every page needs
+    modules = ["app", "views"] + list(PAGES.values()) + OPTIONAL_COMPONENTS
+    rows += [(module, ["streamlit"]) for module in modules]
+    for module, after in rows:
+        ms = import_time(module, after)
+        value = "not installed" if ms is None else f"{ms:.1f}"
+        print(f"{module:<40} {value:>14}")
@@ -0,0 +1,37 @@
+import importlib
+
+# Page title -> module. Modules are imported the first time a page is selected.
+PAGES = {
+    "Home": "views.home",
+    "Frontend": "views.frontend",
+    "Backend": "views.backend",
+    "Machine Learning": "views.machine_learning",
+    "Revenue Model": "views.revenue_model",
+    "FAQs": "views.faqs",
+    "Competition and Roadmap": "views.competition_and_roadmap",
+    "Get Involved": "views.get_involved",
+    "Availability": "views.availability",
+    "Backend Simulator": "views.backend_simulator",
+    "Notification Fan-out": "views.notifications",
+    "Reminder Scheduler": "views.reminders",
+    "Analytics": "views.analytics",
+}
+
+# Pages that need a live Streamlit session; the static export links to them instead
+LIVE_PAGES = {"Availability", "Backend Simulator", "Notification Fan-out", "Reminder Scheduler", "Analytics"}
+
+# Reachable only through ?page=...; not listed in the sidebar, export or search
+HIDDEN_PAGES = {
+    "Admin": "views.admin",
+}
+
+def load_page(name):
+    return importlib.import_module(PAGES.get(name) or HIDDEN_PAGES[name]).render
+
+def load_docs(name):
+    # Pages with interactive demos expose their static text as docs()
+    module = importlib.import_module(PAGES[name])
+    return getattr(module, "docs", module.render)
+
+def has_demo(name):
+    return hasattr(importlib.import_module(PAGES[name]), "docs")
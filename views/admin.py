@@ -0,0 +1,86 @@
+import hmac
+import os
+import time
+
+import pandas as pd
+import streamlit as st
+import assets
+import content
+import profiling
+import sysinfo
+from views import PAGES
+
+def render():
+    # Only served when SLOTIN_ADMIN_TOKEN is set, at ?page=Admin&token=...
+    token = os.environ.get("SLOTIN_ADMIN_TOKEN")
+    if not token:
+        st.error("The admin page is disabled. Set SLOTIN_ADMIN_TOKEN to enable it.")
+        return
+    if not hmac.compare_digest(st.query_params.get("token", ""), token):
+        st.error("Not authorised.")
+        return
+
+    metrics = profiling.METRICS
+    st.title("🛠️ Admin")
+    st.caption(f"Process {os.getpid()}, {sysinfo.current_rss() / 2**20:.0f} MiB resident. Percentiles cover the last {profiling.WINDOW:,} renders of each page across every session.")
+
+    st.subheader("Page Renders")
+    summary = metrics.summary()
+    if summary:
+        rows = []
+        for page, stats in summary.items():
+            row = {
+                "page": page,
+                "renders": stats["renders"],
+                "errors": stats["errors"],
+                "p50 ms": stats["seconds"]["0.5"] * 1000,
+                "p95 ms": stats["seconds"]["0.95"] * 1000,
+                "p99 ms": stats["seconds"]["0.99"] * 1000,
+                "p50 elements": stats["elements"]["0.5"],
+                "p99 elements": stats["elements"]["0.99"],
+            }
+            if "allocated_bytes" in stats:
+                row["p50 retained KiB"] = stats["allocated_bytes"]["0.5"] / 1024
+                row["p99 peak KiB"] = stats["peak_bytes"]["0.99"] / 1024
+            rows.append(row)
+        st.dataframe(pd.DataFrame(rows).set_index("page").sort_values("p95 ms", ascending=False))
+    else:
+        st.write("No pages have rendered in this process yet.")
+
+    left, middle, right = st.columns(3)
+    left.download_button("Download JSON", metrics.to_json(), "page-metrics.json", "application/json")
+    middle.download_button("Download Prometheus text", metrics.to_prometheus(), "page-metrics.prom", "text/plain")
+    if right.button("Reset metrics"):
+        metrics.reset()
+        st.rerun()
+
+    tracing = st.toggle("Trace allocations (tracemalloc; slows every session)", value=metrics.trace_allocations)
+    if tracing != metrics.trace_allocations:
+        metrics.set_tracing(tracing)
+
+    st.subheader("cProfile Capture")
+    with st.form("profile_form"):
+        page = st.selectbox("Profile the next render of", list(PAGES))
+        if st.form_submit_button("Arm"):
+            metrics.arm_profile(page)
+    if metrics.armed():
+        st.info(f"Waiting for the next render of {metrics.armed()}. Open it in any session, then reload this page.")
+
+    profile = metrics.last_profile()
+    if profile:
+        captured = time.strftime("%H:%M:%S", time.localtime(profile["time"]))
+        st.write(f"Last capture: {profile['page']} at {captured}")
+        st.download_button(
+            "Download .prof",
+            profiling.profile_bytes(profile["stats"]),
+            f"{profile['page'].lower().replace(' ', '-')}.prof",
+            "application/octet-stream",
+        )
+        st.caption("Open with `snakeviz`, `tuna` or `flameprof` for a flame graph.")
+        st.code(profiling.profile_text(profile["stats"]), language="text")
+
+    st.subheader("Asset Cache")
+    st.json(assets.stats())
+
+    st.subheader("Content Store")
+    st.json(content.store.stats())
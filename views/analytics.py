@@ -0,0 +1,82 @@
+import os
+import time
+
+import streamlit as st
+import analytics
+
+@st.cache_resource(show_spinner=False)
+def analytics_cache(cache_dir):
+    # One cache per process; every session reads the same totals and memory maps
+    return analytics.AnalyticsCache(cache_dir)
+
+def sample_log():
+    st.info(f"No appointment logs in `{analytics.LOG_DIR}` yet. Drop .csv or .jsonl files there, or generate a synthetic one.")
+    rows = st.select_slider("Rows", [100_000, 1_000_000, 10_000_000, 50_000_000], value=1_000_000)
+    if st.button("Generate sample log"):
+        os.makedirs(analytics.LOG_DIR, exist_ok=True)
+        with st.spinner(f"Writing {rows:,} appointments..."):
+            analytics.write_sample_log(os.path.join(analytics.LOG_DIR, "appointments-sample.csv"), rows)
+        st.rerun()
+
+def render():
+    started = time.perf_counter()
+    st.title("📊 Appointment Analytics")
+    st.write("""
+    Bookings, no-shows and lead times from the appointment event logs. Logs are converted once into a memory-mapped columnar cache with running totals; new files are folded in as they arrive without rescanning history.
+    """)
+
+    cache = analytics_cache(analytics.CACHE_DIR)
+    with st.spinner("Checking for new appointment logs..."):
+        changes = cache.refresh(analytics.LOG_DIR)
+    if changes["rows"] or changes["removed"]:
+        st.toast(f"Ingested {changes['rows']:,} rows from {len(changes['added']) + len(changes['changed'])} file(s) in {changes['seconds']:.1f} s")
+    for failure in cache.manifest["failed"].values():
+        st.warning(f"Skipped until it changes: {failure['error']}")
+    if not cache.rows:
+        sample_log()
+        return
+
+    providers, services = cache.manifest["providers"], cache.manifest["services"]
+    summary = analytics.summary(cache.aggregates, providers, services)
+    bookings, no_shows, cancellations, files = st.columns(4)
+    bookings.metric("Appointments", f"{summary['bookings']:,}")
+    no_shows.metric("No-show rate", f"{summary['no_show_rate']:.1%}")
+    cancellations.metric("Cancelled", f"{summary['cancellation_rate']:.1%}")
+    files.metric("Log files", len(cache.manifest["sources"]))
+
+    left, right = st.columns(2)
+    left.write("Bookings by hour of day")
+    left.bar_chart(summary["by_hour"], sort=False)
+    right.write("Bookings by weekday")
+    right.bar_chart(summary["by_weekday"], sort=False)
+    st.caption(f"First chart {(time.perf_counter() - started) * 1000:.0f} ms after the page started, from the cached totals of {cache.rows:,} rows.")
+
+    st.write("Lead time between booking and appointment")
+    st.bar_chart(summary["lead_time"], sort=False)
+
+    left, right = st.columns(2)
+    left.write("Services")
+    left.dataframe(summary["by_service"].sort_values("bookings", ascending=False).style.format({"no_show_rate": "{:.1%}"}))
+    right.write("Busiest providers")
+    right.dataframe(summary["by_provider"].nlargest(20, "bookings").style.format({"no_show_rate": "{:.1%}"}))
+
+    st.subheader("🔎 Drill Down")
+    left, right = st.columns(2)
+    service = left.selectbox("Service", ["All"] + sorted(services))
+    provider = right.selectbox("Provider", ["All"] + sorted(providers))
+    if service == "All" and provider == "All":
+        return
+    start = time.perf_counter()
+    scanned = cache.scan(None if provider == "All" else provider, None if service == "All" else service)
+    seconds = time.perf_counter() - start
+    detail = analytics.summary(scanned, providers, services)
+    bookings, no_shows, cancellations = st.columns(3)
+    bookings.metric("Appointments", f"{detail['bookings']:,}")
+    no_shows.metric("No-show rate", f"{detail['no_show_rate']:.1%}")
+    cancellations.metric("Cancelled", f"{detail['cancellation_rate']:.1%}")
+    left, right = st.columns(2)
+    left.write("Bookings by hour of day")
+    left.bar_chart(detail["by_hour"], sort=False)
+    right.write("Lead time")
+    right.bar_chart(detail["lead_time"], sort=False)
+    st.caption(f"Scanned {cache.rows:,} rows of memory-mapped columns in {seconds * 1000:.0f} ms.")
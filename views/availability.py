@@ -0,0 +1,75 @@
+from datetime import datetime, time, timedelta
+
+import streamlit as st
+import availability
+
+@st.cache_resource(max_entries=3, show_spinner="Building provider calendars...")
+def shared_calendar(providers, bookings):
+    # One calendar per size, shared by every session so bookings are visible to all
+    calendar = availability.Calendar(providers)
+    calendar.block_outside_hours()
+    calendar.book(*availability.random_bookings(calendar, bookings))
+    return calendar
+
+def render():
+    st.title("📅 Check Availability")
+    st.write("""
+    Each provider's calendar is a bitset with one bit per 15-minute slot for the next year. Conflict checks and bookings are vectorized over whole batches, and a single query scans every provider for the earliest openings.
+    """)
+
+    left, right = st.columns(2)
+    providers = left.select_slider("Providers", [100, 1_000, 10_000], value=1_000)
+    bookings = right.select_slider("Existing bookings", [0, 10_000, 100_000, 1_000_000], value=100_000)
+    calendar = shared_calendar(providers, bookings)
+    st.caption(f"{calendar.nbytes() / 2**20:.1f} MiB of calendars and booking index, {calendar.bytes_per_provider():,.0f} bytes per provider. Providers work 9:00-17:00.")
+
+    st.subheader("🔍 Find Open Slots")
+    left, middle, right = st.columns(3)
+    day = left.date_input("From", calendar.start.date(), min_value=calendar.start.date(), max_value=calendar.time_of(calendar.slots - 1).date())
+    duration = middle.selectbox("Duration", [15, 30, 45, 60, 90, 120], index=1, format_func=lambda m: f"{m} min")
+    count = right.number_input("Openings", 1, 500, 10)
+    subset = st.text_input("Only these providers (comma-separated ids, blank for all)")
+
+    subset_ids = None
+    if subset.strip():
+        subset_ids = sorted({int(part) for part in subset.split(",") if part.strip().isdigit() and int(part) < providers})
+
+    # Never offer openings that have already started
+    start_slot = max(calendar.slot_at(datetime.combine(day, time())), calendar.slot_at(datetime.now()) + 1)
+    length = duration // availability.SLOT_MINUTES
+    started = datetime.now()
+    slots, found = calendar.find_free(length, count, start=start_slot, providers=subset_ids)
+    elapsed = (datetime.now() - started) / timedelta(milliseconds=1)
+    st.caption(f"Searched {providers if subset_ids is None else len(subset_ids):,} providers in {elapsed:.1f} ms.")
+
+    options = [
+        f"Provider {provider} · {calendar.time_of(slot):%a %d %b %H:%M}"
+        for slot, provider in zip(slots.tolist(), found.tolist())
+    ]
+    chosen = st.multiselect("Openings to book", options, default=[])
+    if chosen and st.button("Book selected"):
+        picks = [options.index(option) for option in chosen]
+        accepted = int(calendar.book(found[picks], slots[picks], [length] * len(picks)).sum())
+        message = f"Booked {accepted} of {len(picks)} openings."
+        if accepted < len(picks):
+            message += " The rest were taken by another session in the meantime."
+        # Rerun so the list of openings reflects the new bookings
+        st.session_state["availability_message"] = message
+        st.rerun()
+    if "availability_message" in st.session_state:
+        st.success(st.session_state.pop("availability_message"))
+
+    st.subheader("❌ Cancel a Booking")
+    left, middle, right = st.columns(3)
+    provider = left.number_input("Provider", 0, providers - 1, 0)
+    when = middle.date_input("Date", calendar.start.date(), min_value=calendar.start.date(), max_value=calendar.time_of(calendar.slots - 1).date(), key="cancel_date")
+    at = right.time_input("Start", time(9), step=timedelta(minutes=availability.SLOT_MINUTES))
+    if st.button("Cancel"):
+        if when is None or at is None:
+            st.error("Pick the date and start time of the booking to cancel.")
+            return
+        freed = int(calendar.cancel([provider], [calendar.slot_at(datetime.combine(when, at))])[0])
+        if freed:
+            st.success(f"Cancelled the {freed * availability.SLOT_MINUTES}-minute booking for provider {provider} at {at:%H:%M} on {when:%d %b}.")
+        else:
+            st.warning(f"Provider {provider} has no booking starting at {at:%H:%M} on {when:%d %b}.")
@@ -0,0 +1,55 @@
+import pandas as pd
+import streamlit as st
+import queue_sim
+
+def render():
+    st.title("⚙️ Backend Simulator")
+    st.write("""
+    Bookings flow from the API into a queue and are drained by a pool of workers that send confirmations and update statuses. This page runs that pipeline in-process with an in-memory queue standing in for Redis. Use it to tune batch size and worker count before changing production.
+    """)
+
+    with st.form("queue_form"):
+        left, middle, right = st.columns(3)
+        messages = left.number_input("Bookings", 100, 100_000, 5_000, step=500)
+        rate = left.number_input("Arrival rate (msgs/sec, 0 = unthrottled)", 0, 50_000, 2_000, step=100)
+        queue_size = left.number_input("Queue capacity", 10, 100_000, 1_000, step=100)
+        workers = middle.slider("Workers", 1, 64, 8)
+        batch_size = middle.slider("Dequeue batch size", 1, 200, 10)
+        per_batch_ms = middle.number_input("Round trip per batch (ms)", 0.0, 500.0, 5.0)
+        per_message_ms = right.number_input("Work per message (ms)", 0.0, 100.0, 0.5)
+        failure_rate = right.slider("Failure rate", 0.0, 0.5, 0.01)
+        max_attempts = right.slider("Max attempts", 1, 10, 3)
+        submitted = st.form_submit_button("Run simulation")
+
+    if not submitted:
+        return
+
+    metrics = st.columns(5)
+    cells = [column.empty() for column in metrics]
+    chart = st.empty()
+    history = []
+
+    def show(result):
+        cells[0].metric("Throughput", f"{result['throughput']:,.0f}/s")
+        cells[1].metric("Queue depth", f"{result['depth']:,}")
+        cells[2].metric("p50 latency", f"{result['p50']:.1f} ms")
+        cells[3].metric("p95 latency", f"{result['p95']:.1f} ms")
+        cells[4].metric("p99 latency", f"{result['p99']:.1f} ms")
+
+    def on_tick(result):
+        show(result)
+        history.append(result)
+        frame = pd.DataFrame(history).set_index("elapsed")[["throughput", "depth", "in_flight"]]
+        chart.line_chart(frame)
+
+    result = queue_sim.simulate(
+        messages=messages, rate=rate, workers=workers, batch_size=batch_size, queue_size=queue_size,
+        per_batch_ms=per_batch_ms, per_message_ms=per_message_ms, failure_rate=failure_rate,
+        retry=queue_sim.RetryPolicy(max_attempts=max_attempts), on_tick=on_tick,
+    )
+    show(result)
+    st.write(
+        f"Processed {result['completed']:,} bookings in {result['elapsed']:.2f} s. "
+        f"{result['retried']:,} retries, {result['dead_lettered']:,} dead-lettered; "
+        f"the producer spent {result['producer_blocked']:.2f} s blocked on a full queue."
+    )
@@ -0,0 +1,4 @@
+import content
+
+def render():
+    content.render("home")
@@ -0,0 +1,189 @@
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+import classifier
+import content
+import feedback
+import scoring
+
+def docs():
+    content.render("machine_learning")
+
+@st.cache_resource(max_entries=4, show_spinner="Training the appointment classifier...")
+def trained_model(rows, features, classes, n_estimators, n_jobs):
+    # Shared by every session; a new model is only trained for new parameters
+    trained = classifier.train(rows, features, classes, n_estimators, n_jobs)
+    trained["single_row_seconds"] = classifier.single_row_latency(trained["model"], features)
+    return trained
+
+def classifier_demo():
+    st.subheader("🧪 Try the Appointment Classification Model")
+    st.write("Train the classifier on a synthetic appointments dataset and measure it on this server's hardware.")
+
+    with st.form("classifier_form"):
+        left, right = st.columns(2)
+        rows = left.select_slider("Rows", [5_000, 20_000, 50_000, 100_000, 500_000], value=20_000)
+        features = left.slider("Features", 2, 32, 8)
+        classes = left.slider("Appointment types", 2, len(classifier.APPOINTMENT_TYPES), 4)
+        n_estimators = right.slider("Trees", 10, 300, 50, step=10)
+        n_jobs = right.selectbox("Training jobs (n_jobs)", [-1, 1, 2, 4, 8], format_func=lambda n: "all cores" if n == -1 else str(n))
+        if st.form_submit_button("Train model"):
+            st.session_state["classifier_params"] = (rows, features, classes, n_estimators, n_jobs)
+
+    params = st.session_state.get("classifier_params")
+    if params is None:
+        return
+    trained = trained_model(*params)
+    features = params[1]
+    if trained["classes"] < params[2]:
+        st.caption(f"{features} features can only separate {trained['classes']} appointment types, so the model was trained on {trained['classes']}.")
+
+    fit, accuracy, latency = st.columns(3)
+    fit.metric("Fit time", f"{trained['fit_seconds']:.2f} s")
+    accuracy.metric("Test accuracy", f"{trained['accuracy'] * 100:.2f}%")
+    latency.metric("Single-row inference", f"{trained['single_row_seconds'] * 1000:.2f} ms")
+
+    st.write("Batch inference throughput:")
+    batch_sizes = st.multiselect("Batch sizes", classifier.BATCH_SIZES, default=classifier.BATCH_SIZES)
+    if st.button("Run inference benchmark"):
+        with st.spinner("Predicting..."):
+            results = classifier.batch_throughput(trained["model"], features, sorted(batch_sizes))
+        st.dataframe(
+            [{"Batch size": f"{r['batch_size']:,}", "Seconds": f"{r['seconds']:.4f}", "Rows/sec": f"{r['rows_per_sec']:,.0f}"} for r in results],
+            hide_index=True,
+        )
+
+def batch_scoring():
+    st.subheader("📦 Batch Scoring")
+    params = st.session_state.get("classifier_params")
+    if params is None:
+        st.info("Train a model above to score a CSV of appointments.")
+        return
+    trained = trained_model(*params)
+    st.write(f"Stream a CSV with columns {', '.join(trained['features'])} (and optionally `appointment_id`) through the model in chunks.")
+
+    upload = st.file_uploader("Upload a CSV", type="csv")
+    path = st.text_input("...or a CSV path on the server", disabled=upload is not None)
+    output = st.text_input(f"Write predictions to (a .csv or .parquet file name in `{scoring.SCORES_DIR}`)", "predictions.parquet")
+    left, right = st.columns(2)
+    chunksize = left.select_slider("Rows per chunk", [10_000, 50_000, 100_000, 250_000, 1_000_000], value=100_000)
+    workers = right.number_input("Worker processes (0 scores in this process)", 0, 32, 0)
+
+    source = upload if upload is not None else path
+    if not st.button("Score CSV", disabled=not source or not output):
+        return
+    try:
+        output = scoring.output_path(output)
+    except ValueError as error:
+        st.error(f"Could not write predictions: {error}")
+        return
+    bar = st.progress(0.0)
+    try:
+        stats = scoring.score_csv(
+            source, trained, output, chunksize, workers,
+            progress=lambda fraction, rows: bar.progress(fraction, text=f"{rows:,} rows scored"),
+        )
+    except (OSError, ValueError) as error:
+        bar.empty()
+        st.error(f"Could not score {getattr(source, 'name', source)}: {error}")
+        return
+    bar.progress(1.0, text=f"{stats['rows']:,} rows written to {output}")
+
+    rows, speed, memory = st.columns(3)
+    rows.metric("Rows", f"{stats['rows']:,}")
+    speed.metric("Throughput", f"{stats['rows_per_sec']:,.0f} rows/sec")
+    memory.metric("Peak RSS", f"{stats['peak_rss_bytes'] / 2**20:,.0f} MiB")
+    if "worker_peak_rss_bytes" in stats:
+        st.caption(f"Peak worker RSS: {stats['worker_peak_rss_bytes'] / 2**20:,.0f} MiB")
+
+@st.cache_resource(max_entries=4, show_spinner="Training the feedback model on a stream of mini-batches...")
+def trained_feedback_model(path, stamp, docs, batch_size):
+    # `stamp` changes when the corpus file does, so an edited corpus is retrained
+    batches = feedback.read_batches(path, batch_size) if path else feedback.sample_batches(docs, batch_size)
+    return feedback.train_stream(batches)
+
+def latency_chart(batch_seconds):
+    st.line_chart(pd.DataFrame({"ms per batch": np.array(batch_seconds) * 1000}))
+
+def feedback_demo():
+    st.subheader("💬 Feedback Analyzer")
+    st.write("Sentiment of user feedback from a hashing vectorizer and a linear model trained with `partial_fit`. Corpora are streamed in mini-batches, so they never have to fit in memory.")
+
+    with st.form("feedback_form"):
+        left, right = st.columns(2)
+        docs = left.select_slider("Synthetic feedback to train on", [100_000, 500_000, 1_000_000, 5_000_000], value=500_000)
+        path = left.text_input("...or a CSV on the server with text and sentiment columns")
+        batch_size = right.select_slider("Mini-batch size", [1_000, 5_000, 10_000, 50_000], value=10_000)
+        if st.form_submit_button("Train feedback model"):
+            try:
+                if path:
+                    feedback.check_columns(path, ["text", "sentiment"])
+            except (OSError, ValueError) as error:
+                st.error(f"Could not train on {path}: {error}")
+            else:
+                stamp = os.stat(path).st_mtime_ns if path else None
+                st.session_state["feedback_params"] = (path or None, stamp, docs, batch_size)
+
+    params = st.session_state.get("feedback_params")
+    if params is None:
+        return
+    try:
+        trained = trained_feedback_model(*params)
+    except (OSError, ValueError) as error:
+        st.error(f"Could not train on {params[0]}: {error}")
+        return
+
+    trained_on, speed, accuracy = st.columns(3)
+    trained_on.metric("Docs trained on", f"{trained['docs']:,}")
+    speed.metric("Training throughput", f"{trained['docs_per_sec']:,.0f} docs/sec")
+    accuracy.metric("Progressive accuracy", f"{trained['accuracy']:.1%}")
+    st.caption("Each mini-batch is scored before the model learns from it, so accuracy is measured on unseen feedback.")
+    latency_chart(trained["batch_seconds"])
+
+    text = st.text_input("Try a piece of feedback", "the reminder was really helpful, will book again")
+    if text:
+        start = time.perf_counter()
+        labels, confidence = feedback.predict(trained["model"], [text])
+        st.write(f"**{labels[0]}** ({confidence[0]:.0%} confident, {(time.perf_counter() - start) * 1000:.1f} ms)")
+
+    st.write("Score a feedback corpus")
+    upload = st.file_uploader("Upload a feedback CSV", type="csv")
+    source = upload if upload is not None else st.text_input("...or a feedback CSV path on the server", disabled=upload is not None)
+    output = st.text_input(f"Write sentiments to (a .csv or .parquet file name in `{scoring.SCORES_DIR}`)", "sentiments.parquet")
+    left, right = st.columns(2)
+    workers = left.number_input("Scoring processes (0 scores in this process)", 0, 32, 0)
+    peak = right.number_input("Peak live feedback (docs/sec)", 1, 1_000_000, 500)
+    if not st.button("Score feedback", disabled=not source or not output):
+        return
+    try:
+        output = scoring.output_path(output)
+    except ValueError as error:
+        st.error(f"Could not write sentiments: {error}")
+        return
+    status = st.empty()
+    try:
+        stats = feedback.score_stream(
+            source, trained["model"], output, params[3], workers,
+            progress=lambda done: status.caption(f"{done:,} docs scored..."),
+        )
+    except (OSError, ValueError) as error:
+        status.empty()
+        st.error(f"Could not score {getattr(source, 'name', source)}: {error}")
+        return
+    status.caption(f"{stats['docs']:,} docs written to {output}")
+    latencies = np.array(stats["batch_seconds"]) * 1000
+    speed, p50, p95 = st.columns(3)
+    speed.metric("Throughput", f"{stats['docs_per_sec']:,.0f} docs/sec")
+    p50.metric("p50 batch latency", f"{np.percentile(latencies, 50):.0f} ms")
+    p95.metric("p95 batch latency", f"{np.percentile(latencies, 95):.0f} ms")
+    st.caption(f"{stats['docs_per_sec'] / peak:.1f}x the expected peak of {peak:,} docs/sec; peak RSS {stats['peak_rss_bytes'] / 2**20:,.0f} MiB.")
+    latency_chart(stats["batch_seconds"])
+
+def render():
+    docs()
+    classifier_demo()
+    batch_scoring()
+    feedback_demo()
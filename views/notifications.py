@@ -0,0 +1,45 @@
+import asyncio
+
+import pandas as pd
+import streamlit as st
+import fanout
+
+def render():
+    st.title("🔔 Notification Fan-out")
+    st.write("""
+    Appointment updates are pushed to every connected client over WebSockets. This page runs a broadcaster and thousands of simulated clients over localhost. Each client has a bounded buffer; a newer status for an appointment replaces one the client hasn't received yet, and clients that fall too far behind are evicted.
+    """)
+
+    with st.form("fanout_form"):
+        left, right = st.columns(2)
+        client_counts = left.multiselect("Client counts", [100, 500, 1_000, 2_000, 5_000], default=[100, 500, 1_000])
+        updates = left.number_input("Updates to publish", 100, 100_000, 1_000, step=100)
+        rate = left.number_input("Publish rate (updates/sec, 0 = burst)", 0, 100_000, 500, step=100)
+        appointments = right.number_input("Distinct appointments", 1, 100_000, 500)
+        buffer_limit = right.number_input("Per-client buffer (updates)", 1, 10_000, 256)
+        slow_fraction = right.slider("Slow clients", 0.0, 0.5, 0.0)
+        submitted = st.form_submit_button("Run benchmark")
+
+    if not submitted or not client_counts:
+        return
+
+    results = []
+    table = st.empty()
+    with st.spinner("Connecting clients and publishing..."):
+        for count in sorted(client_counts):
+            results.append(asyncio.run(fanout.run(
+                clients=count, updates=updates, rate=rate, appointments=appointments,
+                buffer_limit=buffer_limit, slow_fraction=slow_fraction,
+            )))
+            frame = pd.DataFrame(results).set_index("clients")
+            frame["KiB/connection"] = frame.pop("bytes_per_connection") / 1024
+            table.dataframe(frame[["delivered", "messages_per_sec", "p50_ms", "p99_ms", "coalesced", "evicted", "KiB/connection"]])
+
+    if not slow_fraction and frame["evicted"].any():
+        st.warning("Clients were evicted although none were slow, so the broadcaster itself fell behind; these numbers don't measure fan-out.")
+
+    left, right = st.columns(2)
+    left.write("Messages/sec and p99 latency (ms) by client count")
+    left.line_chart(frame[["messages_per_sec", "p99_ms"]])
+    right.write("Memory per connection (KiB, both ends)")
+    right.bar_chart(frame["KiB/connection"])